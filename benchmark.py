@@ -0,0 +1,370 @@
+"""Sentetik oyun arşivleri üzerinde tekrarlanabilir hız ölçümü.
+
+Her senaryo için belirli boyut, WAV yoğunluğu ve yerleşimde bir arşiv
+üretilir (aynı seed her zaman aynı baytları üretir) ve tarama, çıkarma
+(çekirdek içi kopya ve tamponlu), sıfırlama, indeks yazma ve inject
+aşamaları ayrı ayrı ölçülür. Sonuçlar --output ile JSON olarak yazılır;
+--compare önceki bir JSON ile karşılaştırır ve yavaşlamaları raporlar.
+
+Senaryolar:
+  uniform     rastgele dolgu arasında orta boy WAV'lar
+  dense       çok sayıda küçük WAV, arada dolgu yok
+  sparse      az sayıda büyük WAV
+  aligned     2048 baytlık sektör sınırlarına hizalanmış WAV'lar
+  false-riff  dolguda çok sayıda chunk yapısı bozuk "RIFF....WAVE" adayı
+  bogus-size  dosya sonunu aşan dev boyut alanlı başlıklar
+  straddle    bölünmüş taramada aralık sınırlarını aşan WAV'lar
+
+--size-mb arşivin toplam boyutudur (WAV'lar dahil). --wav-count, --layout ve
+--max-wav-kb verilirse senaryoların WAV sayısı, yerleşimi ve en büyük WAV
+boyutu bunlarla değiştirilir (straddle hariç).
+
+Kullanım: python benchmark.py [--cases uniform,dense] [--size-mb 32] [--seed 1234]
+                              [--wav-count 200] [--layout random|packed|aligned] [--max-wav-kb 64]
+                              [--repeat 3] [--output sonuc.json] [--compare onceki.json]
+                              [--legacy]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+from wavextractor import engine
+from wavextractor.engine import Engine, ExtractOptions, clear_hit_regions, write_hits
+from wavextractor.index import INDEX_DB_FILE, SqliteIndex, file_fingerprint
+from wavextractor.scanner import find_wavs, map_file, merge_range_results, scan_range
+
+SECTOR = 2048
+WAV_HEADER = 44 # make_wav'ın ürettiği RIFF/fmt/data başlıklarının toplamı
+LAYOUTS = ('random', 'packed', 'aligned')
+STRADDLE_CHUNK = 1024*1024 # straddle senaryosunda taramanın bölündüğü aralık boyutu
+
+CASES = {
+    'uniform': dict(wav_count=200),
+    'dense': dict(wav_count=4000, max_wav=8*1024, layout='packed'),
+    'sparse': dict(wav_count=6, max_wav=4*1024*1024),
+    'aligned': dict(wav_count=200, layout='aligned'),
+    'false-riff': dict(wav_count=200, false_riff=20),
+    'bogus-size': dict(wav_count=200, bogus=2),
+    'straddle': dict(wav_count=0, straddle=STRADDLE_CHUNK),
+}
+PHASES = ('scan', 'extract_buffered', 'extract', 'zero_fill', 'index_write', 'inject')
+
+
+def make_wav(rng, payload_size):
+    """payload_size baytlık PCM verisi içeren geçerli bir WAV üretir."""
+    fmt = struct.pack('<4sIHHIIHH', b'fmt ', 16, 1, 2, 44100, 44100 * 4, 4, 16)
+    data = b'data' + struct.pack('<I', payload_size) + rng.randbytes(payload_size)
+    body = b'WAVE' + fmt + data
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+def make_false_riff(rng):
+    """Sahte aday: boyutu dosyaya sığan, +8'de WAVE taşıyan ama chunk yapısı bozuk RIFF başlığı.
+
+    Tarayıcı her birini aday sayar ve chunk dolaşmasıyla reddeder.
+    """
+    garbage = rng.randbytes(rng.randrange(16, 64))
+    return b'RIFF' + struct.pack('<I', len(garbage) + 4) + b'WAVE' + garbage
+
+
+def make_bogus(rng):
+    """Adversaryal başlık: dosya sonunu aşan dev boyut alanlı RIFF/WAVE."""
+    return b'RIFF' + struct.pack('<I', rng.randrange(0x40000000, 0xFFFFFFFF)) + b'WAVEfmt '
+
+
+def make_filler(rng, size, false_riff=0, bogus=0):
+    """Rastgele dolgu; içine false_riff adet sahte aday (bkz. make_false_riff) ve bogus adet taşan başlık serpilir."""
+    filler = bytearray(rng.randbytes(size))
+    for count, make in ((false_riff, make_false_riff), (bogus, make_bogus)):
+        for _ in range(count):
+            header = make(rng)
+            if len(filler) > len(header):
+                pos = rng.randrange(0, len(filler) - len(header))
+                filler[pos:pos + len(header)] = header
+    return bytes(filler)
+
+
+def make_archive(size, wav_count, seed, max_wav=64*1024, layout='random', false_riff=0, bogus=0):
+    """size baytlık bir arşiv üretir: dolgu arasına wav_count adet WAV gömülür.
+
+    WAV'lar boyuta dahildir; hepsi sığmıyorsa WAV boyutları küçültülür.
+    layout: 'random' (WAV'lar arasında eşit dolgu), 'packed' (WAV'lar art arda)
+    veya 'aligned' (her WAV SECTOR sınırında başlar). false_riff ve bogus, her
+    dolgu bölümüne serpilen sahte aday sayısıdır.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"bilinmeyen yerleşim: {layout}")
+    rng = random.Random(seed)
+    budget = size - (wav_count * SECTOR if layout == 'aligned' else 0) # Hizalama dolguları için pay
+    if wav_count:
+        max_payload = min(max_wav, budget // wav_count - WAV_HEADER)
+        if max_payload < 16:
+            raise ValueError(f"{wav_count} WAV {size} baytlık arşive sığmıyor")
+        payloads = [rng.randrange(min(1024, max_payload), max_payload + 1) for _ in range(wav_count)]
+        budget -= sum(payloads) + wav_count * WAV_HEADER
+    gap = 0 if layout == 'packed' else budget // (wav_count + 1)
+    parts = []
+    written = 0
+    for payload_size in (payloads if wav_count else ()):
+        if gap:
+            parts.append(make_filler(rng, gap, false_riff, bogus))
+            written += gap
+        if layout == 'aligned' and written % SECTOR:
+            pad = SECTOR - written % SECTOR
+            parts.append(bytes(pad))
+            written += pad
+        parts.append(make_wav(rng, payload_size))
+        written += len(parts[-1])
+    if written < size:
+        parts.append(make_filler(rng, size - written, false_riff, bogus))
+    return b''.join(parts)
+
+
+def make_straddle_archive(size, chunk, seed, max_wav=64*1024):
+    """Her chunk sınırının üzerine bir WAV yerleştirir; bölünmüş taramanın birleştirmesini zorlar."""
+    rng = random.Random(seed)
+    parts = []
+    written = 0
+    for boundary in range(chunk, size, chunk):
+        wav = make_wav(rng, rng.randrange(1024, max_wav))
+        start = boundary - rng.randrange(1, len(wav))
+        if start < written:
+            continue
+        parts.append(make_filler(rng, start - written))
+        parts.append(wav)
+        written = start + len(wav)
+    if written < size:
+        parts.append(make_filler(rng, size - written))
+    return b''.join(parts)
+
+
+def build_case(name, size, seed, overrides=None):
+    """Senaryonun arşivini üretir; overrides (wav_count, layout, max_wav) senaryo değerlerini değiştirir."""
+    params = dict(CASES[name])
+    straddle = params.pop('straddle', None)
+    if straddle:
+        return make_straddle_archive(size, straddle, seed)
+    params.update(overrides or {})
+    return make_archive(size, params.pop('wav_count'), seed, **params)
+
+
+def legacy_scan(data):
+    """Eski sürümdeki bayt bayt döngü (karşılaştırma için)."""
+    hits = []
+    offset = 0
+    while offset < len(data) - 12:
+        if data[offset:offset+4] == b'RIFF' and data[offset+8:offset+12] == b'WAVE':
+            size = struct.unpack('<I', data[offset+4:offset+8])[0] + 8
+            hits.append(offset)
+            offset += size
+        else:
+            offset += 1
+    return hits
+
+
+def find_scan(data):
+    return [offset for offset, _, _ in find_wavs(data)[0]]
+
+
+def scan_path(path, chunk=None):
+    """Dosyayı tarar; chunk verilirse Engine'in bölünmüş tarama yolu (aralıklar + birleştirme) kullanılır."""
+    if chunk is None:
+        data = map_file(path)
+        with data:
+            return find_wavs(data)
+    size = os.path.getsize(path)
+    ranges = [(start, min(start + chunk, size)) for start in range(0, size, chunk)]
+    return merge_range_results(path, ranges, [scan_range(path, start, stop) for start, stop in ranges])
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_case(name, data, work_dir):
+    """Tek bir senaryonun tüm aşamalarını sırayla çalıştırır; ({aşama: saniye}, özet) döndürür."""
+    path = os.path.join(work_dir, 'archive.pak')
+    with open(path, 'wb') as f:
+        f.write(data)
+        # Gerçek arşivler gibi diske yazılmış olsun; kirli sayfaların geri yazımı ölçümlere karışmasın
+        os.fsync(f.fileno())
+    extract_dir = os.path.join(work_dir, engine.EXTRACT_DIR_NAME)
+    buffered_dir = os.path.join(work_dir, 'buffered')
+    os.mkdir(extract_dir)
+    os.mkdir(buffered_dir)
+    options = ExtractOptions(dedupe=False)
+    timings = {}
+
+    found, timings['scan'] = timed(scan_path, path, CASES[name].get('straddle'))
+    hits = found[0]
+    _, timings['extract_buffered'] = timed(write_hits, path, buffered_dir, *found, options._replace(zero_copy=False))
+    shutil.rmtree(buffered_dir)
+    (entries, _, regions), timings['extract'] = timed(write_hits, path, extract_dir, *found, options)
+    _, timings['zero_fill'] = timed(clear_hit_regions, path, regions, options)
+
+    def write_index():
+        index = SqliteIndex(os.path.join(work_dir, INDEX_DB_FILE))
+        index.update_file(path, entries, 0, file_fingerprint(path))
+        index.close()
+    _, timings['index_write'] = timed(write_index)
+    _, timings['inject'] = timed(Engine(work_dir).inject)
+
+    with open(path, 'rb') as f:
+        restored = f.read() == data
+    wav_bytes = sum(size for _, size, _ in hits)
+    return timings, {'wavs': len(hits), 'wav_bytes': wav_bytes, 'rejected': len(found[1]),
+                     'overflows': len(found[2]), 'restored': restored}
+
+
+def phase_bytes(phase, archive_bytes, wav_bytes):
+    """MB/s için aşamanın işlediği bayt: tarama tüm arşivi, diğerleri yalnızca WAV'ları işler."""
+    if phase == 'scan':
+        return archive_bytes
+    if phase == 'index_write':
+        return None
+    return wav_bytes
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suite(cases, size, seed, repeat, overrides=None):
+    results = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'size_mb': size // (1024 * 1024),
+        'seed': seed,
+        'overrides': overrides or {},
+        'cases': {},
+    }
+    for name in cases:
+        data = build_case(name, size, seed, overrides)
+        best = None
+        for _ in range(repeat):
+            work_dir = tempfile.mkdtemp(prefix='wavbench_')
+            try:
+                timings, summary = run_case(name, data, work_dir)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            best = timings if best is None else {phase: min(best[phase], timings[phase]) for phase in PHASES}
+
+        phases = {}
+        for phase in PHASES:
+            nbytes = phase_bytes(phase, len(data), summary['wav_bytes'])
+            seconds = best[phase]
+            mb_s = nbytes / (1024 * 1024) / seconds if nbytes is not None and seconds else None
+            phases[phase] = {'seconds': round(seconds, 6), 'mb_s': round(mb_s, 1) if mb_s is not None else None}
+        results['cases'][name] = dict(archive_bytes=len(data), **summary, phases=phases)
+        print_case(name, results['cases'][name])
+    return results
+
+
+def print_case(name, case):
+    flag = "" if case['restored'] else "  [!] inject sonrası arşiv orijinalle eşleşmiyor"
+    print(f"{name}: {case['archive_bytes'] / (1024 * 1024):.1f} MB arşiv, {case['wavs']} WAV "
+          f"({case['wav_bytes'] / (1024 * 1024):.1f} MB), {case['rejected']} geçersiz, "
+          f"{case['overflows']} taşan başlık{flag}")
+    for phase, value in case['phases'].items():
+        mb_s = f"{value['mb_s']:10.1f} MB/s" if value['mb_s'] is not None else ""
+        print(f"  {phase:<18} {value['seconds']:8.3f} s  {mb_s}")
+
+
+def compare(results, baseline, threshold):
+    """Ortak senaryo/aşamaları karşılaştırır; eşikten fazla yavaşlayanların sayısını döndürür."""
+    print(f"Karşılaştırma: {baseline.get('commit')} -> {results.get('commit')}")
+    regressions = 0
+    for name, case in results['cases'].items():
+        old_case = baseline.get('cases', {}).get(name)
+        if old_case is None:
+            continue
+        for phase, value in case['phases'].items():
+            old = old_case['phases'].get(phase)
+            if not old or not old['seconds']:
+                continue
+            ratio = value['seconds'] / old['seconds']
+            mark = ""
+            if ratio > 1 + threshold:
+                mark = "  [!] yavaşladı"
+                regressions += 1
+            print(f"  {name:<12} {phase:<18} {old['seconds']:8.3f} s -> {value['seconds']:8.3f} s  x{ratio:5.2f}{mark}")
+    return regressions
+
+
+def run_legacy(size, seed):
+    """Eski bayt bayt tarama ile find_wavs'ı aynı veri üzerinde karşılaştırır (yavaş)."""
+    data = build_case('uniform', size, seed)
+    print(f"Eski tarama karşılaştırması: {len(data) / (1024 * 1024):.1f} MB")
+    results = []
+    for label, func in (("önce", legacy_scan), ("sonra", find_scan)):
+        hits, elapsed = timed(func, data)
+        mb_s = len(data) / (1024 * 1024) / elapsed if elapsed else float('inf')
+        print(f"  {label:<12} {elapsed:8.3f} s  {mb_s:10.1f} MB/s  {len(hits)} WAV")
+        results.append(hits)
+    if results[0] != results[1]:
+        raise SystemExit("[!] Sonuçlar eşleşmiyor!")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cases', default=','.join(CASES), help="Virgülle ayrılmış senaryolar")
+    parser.add_argument('--size-mb', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--wav-count', type=int, help="Arşivdeki WAV sayısı (senaryonun değerini değiştirir)")
+    parser.add_argument('--layout', choices=LAYOUTS, help="WAV yerleşimi (senaryonun değerini değiştirir)")
+    parser.add_argument('--max-wav-kb', type=int, help="En büyük WAV boyutu, KB (senaryonun değerini değiştirir)")
+    parser.add_argument('--repeat', type=int, default=3, help="Her aşamanın en iyi süresi alınır")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--compare', help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Yavaşlama eşiği (0.10 = %%10)")
+    parser.add_argument('--legacy', action='store_true', help="Eski bayt bayt taramayı da ölç")
+    args = parser.parse_args()
+
+    cases = [name.strip() for name in args.cases.split(',') if name.strip()]
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f"bilinmeyen senaryo: {', '.join(unknown)}")
+
+    size = args.size_mb * 1024 * 1024
+    overrides = {key: value for key, value in (('wav_count', args.wav_count), ('layout', args.layout),
+                 ('max_wav', args.max_wav_kb * 1024 if args.max_wav_kb else None)) if value is not None}
+    if args.legacy:
+        run_legacy(size, args.seed)
+    try:
+        results = run_suite(cases, size, args.seed, args.repeat, overrides)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"[+] Sonuçlar yazıldı: {args.output}")
+
+    failed = any(not case['restored'] for case in results['cases'].values())
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Testlerde ortak yardımcılar: benchmark.py üreteçleriyle sentetik arşivler ve motor kısayolları."""
+import hashlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import benchmark  # noqa: E402
+from wavextractor.engine import Engine  # noqa: E402
+
+ARCHIVE_SIZE = 1024 * 1024
+
+
+def write_archive(path, seed, wav_count=20, size=ARCHIVE_SIZE, **kwargs):
+    """benchmark.make_archive ile arşiv yazar ve içeriğini döndürür."""
+    data = benchmark.make_archive(size, wav_count, seed, **kwargs)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return data
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def digests(directory):
+    """Dizindeki arşivlerin (extract klasörü ve indeksler hariç) içerik özetleri."""
+    return {name: hashlib.md5(read(os.path.join(directory, name))).hexdigest()
+            for name in sorted(os.listdir(directory)) if name.endswith('.pak')}
+
+
+def run(directory, mode, logs=None, **options):
+    """Motoru tek işçiyle çalıştırır; (mesaj, motor) döndürür."""
+    options.setdefault('workers', 1)
+    engine = Engine(str(directory), log=logs.append if logs is not None else (lambda message: None), **options)
+    return engine.run(mode), engine
+
+
+@pytest.fixture
+def archives(tmp_path):
+    """Üç arşivli bir dizin; (dizin, {ad: içerik}) döndürür."""
+    originals = {f'a{i}.pak': write_archive(tmp_path / f'a{i}.pak', seed=i) for i in range(3)}
+    return tmp_path, originals
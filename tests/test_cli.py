@@ -0,0 +1,39 @@
+"""Arayüzsüz komut satırının çıkış kodları."""
+import random
+import struct
+
+import benchmark
+from conftest import digests
+from wavextractor.__main__ import main
+
+
+def test_rejected_header_is_not_an_error(tmp_path, capsys):
+    rng = random.Random(1)
+    bogus = b'RIFF' + struct.pack('<I', 300) + b'WAVE' + rng.randbytes(296)
+    (tmp_path / 'a.pak').write_bytes(rng.randbytes(2000) + bogus + rng.randbytes(500)
+                                     + benchmark.make_wav(rng, 3000) + rng.randbytes(100))
+    before = digests(tmp_path)
+    for command in ('scan', 'extract', 'inject'):
+        workers = ['-j', '1'] if command != 'inject' else []
+        assert main([command, str(tmp_path), *workers]) == 0
+    assert '[!]' not in capsys.readouterr().out
+    assert digests(tmp_path) == before
+
+
+def test_missing_directory_fails(tmp_path):
+    missing = tmp_path / 'yok'
+    for command in ('scan', 'extract', 'inject'):
+        assert main([command, str(missing)]) == 1
+    assert not missing.exists()
+
+
+def test_import_json_without_index_fails(tmp_path, capsys):
+    assert main(['import-json', str(tmp_path)]) == 1
+    assert '[!]' in capsys.readouterr().out
+
+
+def test_missing_wav_is_an_error(tmp_path):
+    (tmp_path / 'a.pak').write_bytes(bytes(1000) + benchmark.make_wav(random.Random(2), 3000))
+    assert main(['extract', str(tmp_path), '-j', '1', '-q']) == 0
+    (tmp_path / 'extracted_wavs' / 'a.pak_1000.wav').unlink()
+    assert main(['inject', str(tmp_path), '-q']) == 1
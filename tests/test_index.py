@@ -0,0 +1,54 @@
+"""İndeksin tekrar taramalarda tutarlı kalması."""
+import json
+import sqlite3
+
+import pytest
+
+from conftest import read, run, write_archive
+from wavextractor.index import INDEX_DB_FILE, INDEX_FILE
+
+
+def count_entries(directory, index_format):
+    if index_format == 'json':
+        with open(directory / INDEX_FILE, encoding='utf-8') as f:
+            return len(json.load(f))
+    connection = sqlite3.connect(directory / INDEX_DB_FILE)
+    try:
+        return connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize('index_format', ['sqlite', 'json'])
+def test_replaced_file_drops_stale_entries(tmp_path, index_format):
+    write_archive(tmp_path / 'a.pak', seed=1, wav_count=30)
+    kept = write_archive(tmp_path / 'b.pak', seed=3, wav_count=30)
+    run(tmp_path, 'extract', index_format=index_format)
+    replaced = write_archive(tmp_path / 'a.pak', seed=2, wav_count=10)
+    logs = []
+    run(tmp_path, 'extract', logs=logs, index_format=index_format)
+    assert count_entries(tmp_path, index_format) == 40
+    assert any('eski giriş' in line for line in logs)
+    run(tmp_path, 'inject')
+    assert read(tmp_path / 'a.pak') == replaced
+    assert read(tmp_path / 'b.pak') == kept
+
+
+def test_json_index_merges_with_existing_entries(tmp_path):
+    first = write_archive(tmp_path / 'a.pak', seed=1, wav_count=30)
+    run(tmp_path, 'extract', index_format='json')
+    second = write_archive(tmp_path / 'c.pak', seed=2, wav_count=2)
+    run(tmp_path, 'extract', index_format='json')
+    assert count_entries(tmp_path, 'json') == 32
+    run(tmp_path, 'inject')
+    assert read(tmp_path / 'a.pak') == first
+    assert read(tmp_path / 'c.pak') == second
+
+
+def test_unchanged_files_are_skipped(archives):
+    directory, _ = archives
+    run(directory, 'extract')
+    logs = []
+    _, engine = run(directory, 'extract', logs=logs)
+    assert engine.metrics.counters['errors'] == 0
+    assert count_entries(directory, 'sqlite') == 60
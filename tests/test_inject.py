@@ -0,0 +1,52 @@
+"""Sağlama toplamlarıyla değişiklik farkında, tekrarlanabilir inject."""
+import sqlite3
+
+from conftest import read, run, write_archive
+from wavextractor.engine import EXTRACT_DIR_NAME
+from wavextractor.index import INDEX_DB_FILE
+
+
+def checksummed(directory):
+    connection = sqlite3.connect(directory / INDEX_DB_FILE)
+    try:
+        return connection.execute('SELECT COUNT(crc32) FROM entries').fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_second_inject_writes_nothing(archives):
+    directory, _ = archives
+    run(directory, 'extract')
+    _, first = run(directory, 'inject')
+    assert first.metrics.counters['unchanged_entries'] == 0
+    _, second = run(directory, 'inject')
+    assert second.metrics.counters['unchanged_entries'] == 60
+    assert second.metrics.counters['injected_bytes'] == 0
+
+
+def test_only_edited_wav_is_written(archives):
+    directory, originals = archives
+    run(directory, 'extract')
+    run(directory, 'inject')
+    extracted = sorted((directory / EXTRACT_DIR_NAME).glob('a0.pak_*.wav'))[0]
+    with open(extracted, 'r+b') as f:
+        f.seek(64)
+        f.write(b'\x01' * 16)
+    _, engine = run(directory, 'inject')
+    assert engine.metrics.counters['unchanged_entries'] == 59
+    assert read(directory / 'a1.pak') == originals['a1.pak']
+
+
+def test_output_dir_rerun_keeps_checksums(tmp_path):
+    source = tmp_path / 'src'
+    output = tmp_path / 'out'
+    source.mkdir()
+    write_archive(source / 'a.pak', seed=1, wav_count=5)
+    run(source, 'extract', output_dir=str(output))
+    assert checksummed(source) == 5
+    # İkinci çalıştırmada WAV'lar zaten çıkarılmış; sağlama toplamları korunmalı
+    run(source, 'extract', output_dir=str(output))
+    assert checksummed(source) == 5
+    run(source, 'inject', output_dir=str(output))
+    _, engine = run(source, 'inject', output_dir=str(output))
+    assert engine.metrics.counters['unchanged_entries'] == 5
@@ -0,0 +1,112 @@
+"""Yarım kalan çıkarmanın günlükten sürdürülmesi ve geri alınması."""
+import os
+import random
+import zlib
+from functools import partial
+
+import pytest
+
+import benchmark
+from conftest import digests, read, run, write_archive
+from wavextractor import engine, journal
+from wavextractor.engine import EXTRACT_DIR_NAME
+from wavextractor.index import INDEX_DB_FILE
+from wavextractor.journal import JOURNAL_FILE, Journal
+from wavextractor.scanner import find_wavs
+
+
+@pytest.fixture
+def interrupted(tmp_path, monkeypatch):
+    """Üçüncü dosyadan sonra kesilen bir extract; (dizin, kesilmeden önceki özetler) döndürür."""
+    for i in range(6):
+        write_archive(tmp_path / f'a{i}.pak', seed=i)
+    before = digests(tmp_path)
+    file_done = Journal.file_done
+    done = []
+
+    def crash(self, path, fingerprint):
+        file_done(self, path, fingerprint)
+        done.append(path)
+        if len(done) == 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(Journal, 'file_done', crash)
+    with pytest.raises(KeyboardInterrupt):
+        run(tmp_path, 'extract')
+    monkeypatch.setattr(Journal, 'file_done', file_done)
+    assert os.path.exists(tmp_path / JOURNAL_FILE)
+    return tmp_path, before
+
+
+def test_resume_after_interrupt(interrupted):
+    directory, before = interrupted
+    logs = []
+    _, engine = run(directory, 'extract', logs=logs)
+    assert engine.metrics.counters['errors'] == 0
+    assert any('yarım kalan çalıştırmada tamamlandığı' in line for line in logs)
+    assert not os.path.exists(directory / JOURNAL_FILE)
+    run(directory, 'inject')
+    assert digests(directory) == before
+
+
+def test_revert_after_interrupt(interrupted):
+    directory, before = interrupted
+    _, engine = run(directory, 'revert')
+    assert engine.metrics.counters['errors'] == 0
+    assert not os.path.exists(directory / JOURNAL_FILE)
+    assert digests(directory) == before
+
+
+def test_resume_rewrites_corrupt_wavs(tmp_path):
+    """Kalıcı sayılan ama çökmeden sonra NUL dolu kalan WAV'lar yeniden yazılır, bölgeleri korunur."""
+    path = os.path.join(tmp_path, 'a.pak')
+    data = write_archive(path, seed=1, wav_count=5)
+    extract_dir = tmp_path / EXTRACT_DIR_NAME
+    extract_dir.mkdir()
+    hits = find_wavs(data)[0]
+    log = Journal(str(tmp_path / JOURNAL_FILE), str(tmp_path / INDEX_DB_FILE))
+    for offset, size, ext in hits:
+        extract_path = extract_dir / f'a.pak_{offset}.{ext}'
+        extract_path.write_bytes(bytes(size))
+        log.append({'file_path': path, 'offset': offset, 'length': size, 'extract_path': str(extract_path),
+                    'crc32': zlib.crc32(data[offset:offset + size])})
+    log.commit()
+    log.close()
+    run(tmp_path, 'extract')
+    for offset, size, ext in hits:
+        assert read(extract_dir / f'a.pak_{offset}.{ext}') == data[offset:offset + size]
+    run(tmp_path, 'inject')
+    assert read(path) == data
+
+
+def test_commits_are_batched(tmp_path):
+    rng = random.Random(1)
+    for i in range(300):
+        (tmp_path / f'f{i:03}.pak').write_bytes(rng.randbytes(3000) + benchmark.make_wav(rng, 2000) + rng.randbytes(1000))
+    before = digests(tmp_path)
+    _, engine = run(tmp_path, 'extract')
+    assert engine.metrics.counters['journal_commits'] <= 5
+    run(tmp_path, 'inject')
+    assert digests(tmp_path) == before
+
+
+@pytest.mark.parametrize('pack', [False, True])
+def test_commit_syncs_written_wavs(archives, monkeypatch, pack):
+    """Her girişte kalıcı yazılsa bile fsync edilen WAV'lar o anda diske yazılmış olmalı."""
+    directory, _ = archives
+    before = digests(directory)
+    missing = []
+    fsync_path = journal.fsync_path
+
+    def checked(path):
+        if not os.path.exists(path):
+            missing.append(path)
+        fsync_path(path)
+
+    monkeypatch.setattr(journal, 'fsync_path', checked)
+    monkeypatch.setattr(engine, 'Journal', partial(Journal, commit_entries=1))
+    _, extracted = run(directory, 'extract', pack=pack)
+    assert not missing
+    assert extracted.metrics.counters['journal_commits'] > 3
+    run(directory, 'inject')
+    assert digests(directory) == before
@@ -0,0 +1,19 @@
+"""-o: orijinallere dokunmadan klonlar üzerinde çalışma."""
+from conftest import read, run, write_archive
+
+
+def test_output_dir_leaves_originals(tmp_path):
+    source = tmp_path / 'src'
+    output = tmp_path / 'out'
+    source.mkdir()
+    data = write_archive(source / 'a.pak', seed=1)
+    run(source, 'extract', output_dir=str(output))
+    assert read(source / 'a.pak') == data
+    zeroed = read(output / 'a.pak')
+    assert zeroed != data
+    run(source, 'inject', output_dir=str(output))
+    assert read(output / 'a.pak') == data
+    # -o ile tekrar extract, klonu kaynak dosyadan yeniden üretip sıfırlamalı
+    run(source, 'extract', output_dir=str(output))
+    assert read(output / 'a.pak') == zeroed
+    assert read(source / 'a.pak') == data
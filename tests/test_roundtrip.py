@@ -0,0 +1,48 @@
+"""extract → düzenle → inject gidiş-dönüşleri."""
+import random
+
+import pytest
+
+import benchmark
+from conftest import digests, read, run, write_archive
+from wavextractor.engine import EXTRACT_DIR_NAME
+
+
+@pytest.mark.parametrize('options', [
+    pytest.param({}, id='sqlite'),
+    pytest.param({'index_format': 'json'}, id='json'),
+    pytest.param({'dedupe': True}, id='dedupe'),
+    pytest.param({'zero_copy': False, 'punch_holes': True}, id='buffered'),
+    pytest.param({'pack': True}, id='pack'),
+])
+def test_extract_inject_restores_archives(archives, options):
+    directory, originals = archives
+    before = digests(directory)
+    run(directory, 'extract', **options)
+    assert digests(directory) != before
+    _, engine = run(directory, 'inject')
+    assert digests(directory) == before
+    assert engine.metrics.counters['errors'] == 0
+
+
+def test_layouts_roundtrip(tmp_path):
+    for layout in benchmark.LAYOUTS:
+        write_archive(tmp_path / f'{layout}.pak', seed=7, wav_count=30, layout=layout)
+    before = digests(tmp_path)
+    run(tmp_path, 'extract')
+    run(tmp_path, 'inject')
+    assert digests(tmp_path) == before
+
+
+def test_modified_wav_is_injected(tmp_path):
+    rng = random.Random(3)
+    wav = benchmark.make_wav(rng, 4000)
+    data = bytes(1000) + wav + rng.randbytes(3000)
+    (tmp_path / 'b.pak').write_bytes(data)
+    run(tmp_path, 'extract')
+    extracted = tmp_path / EXTRACT_DIR_NAME / 'b.pak_1000.wav'
+    assert read(extracted) == wav
+    edited = wav[:100] + b'\x01' * 50 + wav[150:]
+    extracted.write_bytes(edited)
+    run(tmp_path, 'inject')
+    assert read(tmp_path / 'b.pak') == bytes(1000) + edited + data[1000 + len(wav):]
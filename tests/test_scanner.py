@@ -0,0 +1,138 @@
+"""Biçim ayrıştırıcıları: bayt düzeyinde elle kurulmuş kapsayıcılar."""
+import struct
+
+import pytest
+
+from wavextractor.scanner import RF64_SIZE_FIELD, WWISE_FORMAT_TAG, describe_hit, find_wavs
+
+FILLER = b'\xa5' * 100
+
+
+def chunk(chunk_id, body, endian='<'):
+    return chunk_id + struct.pack(endian + 'I', len(body)) + body + b'\0' * (len(body) & 1)
+
+
+def fmt_chunk(tag=1, channels=2, rate=44100, bits=16, endian='<'):
+    block = channels * bits // 8
+    return chunk(b'fmt ', struct.pack(endian + 'HHIIHH', tag, channels, rate, rate * block, block, bits), endian)
+
+
+def riff(chunks, magic=b'RIFF', endian='<'):
+    body = b'WAVE' + b''.join(chunks)
+    return magic + struct.pack(endian + 'I', len(body)) + body
+
+
+def rf64(payload, magic=b'RF64'):
+    """32 bit boyut alanları 0xFFFFFFFF olan, gerçek boyutları ds64'te tutan kayıt."""
+    fmt = fmt_chunk()
+    riff_size = 4 + 8 + 28 + len(fmt) + 8 + len(payload)
+    ds64 = chunk(b'ds64', struct.pack('<QQQI', riff_size, len(payload), len(payload) // 4, 0))
+    data = b'data' + struct.pack('<I', RF64_SIZE_FIELD) + payload
+    return magic + struct.pack('<I', RF64_SIZE_FIELD) + b'WAVE' + ds64 + fmt + data
+
+
+def ogg_page(header_type, granule, serial, sequence, payload):
+    lacing = bytes([255] * (len(payload) // 255) + [len(payload) % 255])
+    return (b'OggS' + bytes([0, header_type]) + struct.pack('<qIII', granule, serial, sequence, 0)
+            + bytes([len(lacing)]) + lacing + payload)
+
+
+def vorbis_stream(serial=7, rate=22050, channels=1, samples=44100):
+    identification = b'\x01vorbis' + struct.pack('<IBI', 0, channels, rate) + bytes(15)
+    return [
+        ogg_page(2, 0, serial, 0, identification),
+        ogg_page(0, samples // 2, serial, 1, b'\x11' * 300),
+        ogg_page(4, samples, serial, 2, b'\x22' * 100),
+    ]
+
+
+def scan(record, ogg=False):
+    return find_wavs(FILLER + record + FILLER, ogg=ogg)
+
+
+@pytest.mark.parametrize('record, ext', [
+    (riff([fmt_chunk(), chunk(b'data', bytes(400))]), 'wav'),
+    (riff([fmt_chunk(endian='>'), chunk(b'data', bytes(400), '>')], b'RIFX', '>'), 'wav'),
+    (riff([fmt_chunk(tag=WWISE_FORMAT_TAG), chunk(b'data', bytes(400))]), 'wem'),
+    (rf64(bytes(400)), 'wav'),
+    (rf64(bytes(400), b'BW64'), 'wav'),
+], ids=['riff', 'rifx', 'wem', 'rf64', 'bw64'])
+def test_accepted(record, ext):
+    assert scan(record) == ([(len(FILLER), len(record), ext)], [], [])
+
+
+@pytest.mark.parametrize('chunks', [
+    [chunk(b'data', bytes(400)), fmt_chunk()], # data, fmt'den önce
+    [fmt_chunk(channels=0), chunk(b'data', bytes(400))],
+    [chunk(b'\x00\x01\x02\x03', bytes(40)), fmt_chunk(), chunk(b'data', bytes(400))],
+    [fmt_chunk()], # data yok
+], ids=['data-first', 'no-channels', 'binary-chunk-id', 'no-data'])
+def test_rejected_chunk_walk(chunks):
+    record = riff(chunks)
+    assert scan(record) == ([], [(len(FILLER), len(record))], [])
+
+
+def test_rf64_without_ds64_is_rejected():
+    record = b'RF64' + struct.pack('<I', RF64_SIZE_FIELD) + b'WAVE' + fmt_chunk() + chunk(b'data', bytes(400))
+    hits, rejected, _ = scan(record)
+    assert hits == [] and rejected
+
+
+def test_overflow_does_not_stop_scan():
+    truncated = riff([fmt_chunk(), chunk(b'data', bytes(400))])
+    truncated = truncated[:4] + struct.pack('<I', 1 << 30) + truncated[8:]
+    record = riff([fmt_chunk(), chunk(b'data', bytes(400))])
+    data = FILLER + truncated + FILLER + record
+    hits, rejected, overflows = find_wavs(data)
+    assert overflows == [(len(FILLER), (1 << 30) + 8)]
+    assert hits == [(len(data) - len(record), len(record), 'wav')]
+
+
+def test_ogg_only_with_option():
+    record = b''.join(vorbis_stream())
+    assert scan(record) == ([], [], [])
+    assert scan(record, ogg=True) == ([(len(FILLER), len(record), 'ogg')], [], [])
+
+
+def test_ogg_interleaved_streams():
+    first, second = vorbis_stream(serial=1), vorbis_stream(serial=2)
+    record = b''.join([first[0], second[0], first[1], second[1], first[2], second[2]])
+    assert scan(record, ogg=True)[0] == [(len(FILLER), len(record), 'ogg')]
+
+
+def test_ogg_broken_chain_is_rejected():
+    pages = vorbis_stream()
+    pages[1] = ogg_page(0, 100, 99, 1, b'\x11' * 300) # Açılmamış akışın sayfası
+    hits, rejected, _ = scan(b''.join(pages), ogg=True)
+    assert hits == [] and rejected[0][0] == len(FILLER)
+
+
+def test_ogg_eos_past_eof_overflows():
+    pages = vorbis_stream()
+    data = FILLER + pages[0] + pages[1] + pages[2][:40]
+    hits, rejected, overflows = find_wavs(data, ogg=True)
+    assert hits == [] and overflows == [(len(FILLER), len(data) - len(FILLER) + len(pages[2]) - 40)]
+    # Tarama sürer; akışın ortasındaki sayfalar BOS olmadığından aday sayılmaz
+    assert [offset for offset, _ in rejected] == [len(FILLER) + len(pages[0]), len(FILLER) + len(pages[0]) + len(pages[1])]
+    # EOS sayfası hiç yoksa zincir dosya sonunda kopar
+    hits, rejected, overflows = find_wavs(FILLER + pages[0] + pages[1], ogg=True)
+    assert hits == [] and overflows[0][0] == len(FILLER)
+
+
+def test_describe_riff():
+    payload = bytes(44100 * 4)
+    record = riff([fmt_chunk(), chunk(b'data', payload)])
+    info = describe_hit(FILLER + record, len(FILLER), len(record), 'wav')
+    assert (info.sample_rate, info.channels, info.bits, info.duration) == (44100, 2, 16, 1.0)
+
+
+def test_describe_rf64_uses_ds64_size():
+    record = rf64(bytes(44100 * 2))
+    info = describe_hit(record, 0, len(record), 'wav')
+    assert (info.sample_rate, info.channels, info.duration) == (44100, 2, 0.5)
+
+
+def test_describe_ogg():
+    record = b''.join(vorbis_stream(rate=22050, channels=1, samples=44100))
+    info = describe_hit(record, 0, len(record), 'ogg')
+    assert (info.sample_rate, info.channels, info.bits, info.duration) == (22050, 1, None, 2.0)
@@ -0,0 +1,48 @@
+"""Çıkarılan WAV deposu: içerik özetiyle tekilleştirme ve paket dosyası."""
+import os
+import random
+
+import pytest
+
+import benchmark
+from conftest import read, run
+from wavextractor.engine import EXTRACT_DIR_NAME
+
+
+@pytest.mark.parametrize('dedupe', [False, True])
+def test_editing_duplicate_wav(tmp_path, dedupe):
+    """Dedupe kapalıyken aynı içerikli iki WAV'dan birini düzenlemek diğerini etkilemez."""
+    rng = random.Random(5)
+    wav = benchmark.make_wav(rng, 4000)
+    second = 1000 + len(wav) + 3000
+    (tmp_path / 'b.pak').write_bytes(bytes(1000) + wav + rng.randbytes(3000) + wav + bytes(500))
+    run(tmp_path, 'extract', dedupe=dedupe)
+    with open(tmp_path / EXTRACT_DIR_NAME / 'b.pak_1000.wav', 'r+b') as f:
+        f.seek(100)
+        f.write(b'\x01' * 50)
+    run(tmp_path, 'inject')
+    untouched = read(tmp_path / 'b.pak')[second:second + len(wav)] == wav
+    assert untouched != dedupe
+
+
+def test_dedupe_does_not_reuse_edited_blob(tmp_path):
+    rng = random.Random(5)
+    wav = benchmark.make_wav(rng, 4000)
+    (tmp_path / 'b.pak').write_bytes(bytes(1000) + wav + bytes(500))
+    run(tmp_path, 'extract', dedupe=True)
+    with open(tmp_path / EXTRACT_DIR_NAME / 'b.pak_1000.wav', 'r+b') as f:
+        f.seek(100)
+        f.write(b'\x01' * 50)
+    (tmp_path / 'c.pak').write_bytes(bytes(700) + wav + bytes(100))
+    run(tmp_path, 'extract', dedupe=True)
+    assert read(tmp_path / EXTRACT_DIR_NAME / 'c.pak_700.wav') == wav
+
+
+def test_pack_unpack(archives):
+    directory, _ = archives
+    run(directory, 'extract', pack=True)
+    extract_dir = directory / EXTRACT_DIR_NAME
+    assert not any(name.endswith('.wav') for name in os.listdir(extract_dir))
+    message, engine = run(directory, 'unpack')
+    assert engine.metrics.counters['errors'] == 0
+    assert any(name.endswith('.wav') for name in os.listdir(extract_dir))
@@ -0,0 +1,20 @@
+"""Oyun arşivlerine gömülü WAV seslerini çıkaran ve geri inject eden motor.
+
+PyQt5'e bağımlı değildir; arayüz wavextractor.gui, komut satırı ise
+python -m wavextractor ile kullanılır.
+"""
+from .engine import EXTRACT_DIR_NAME, Engine, ExtractOptions, scan_file
+from .index import (
+    INDEX_DB_FILE, INDEX_FILE, JsonIndex, SqliteIndex, export_json, file_fingerprint, find_index,
+    import_json, open_index
+)
+from .metrics import METRICS_FILE, Metrics, Profiler
+from .scanner import find_wavs, map_file
+
+__all__ = [
+    'EXTRACT_DIR_NAME', 'Engine', 'ExtractOptions', 'scan_file',
+    'INDEX_DB_FILE', 'INDEX_FILE', 'JsonIndex', 'SqliteIndex', 'export_json', 'file_fingerprint',
+    'find_index', 'import_json', 'open_index',
+    'METRICS_FILE', 'Metrics', 'Profiler',
+    'find_wavs', 'map_file',
+]
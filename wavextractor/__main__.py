@@ -0,0 +1,209 @@
+"""Arayüzsüz kullanım: python -m wavextractor {extract,inject,verify,scan,query,unpack,recover,revert,export-json,import-json} DİZİN
+
+PyQt5 yüklenmez; CI sunucularında ekran gerekmeden çalışır. Log satırları
+stdout'a, ilerleme (terminal ise) stderr'e yazılır. İşlem sırasında hata
+sayılırsa (ölçümlerdeki errors sayacı) ya da işlem başlatılamazsa çıkış kodu
+1'dir; atlanan geçersiz başlıklar hata sayılmaz.
+"""
+import argparse
+import os
+import sys
+
+from .engine import EXTRACT_DIR_NAME, INFLIGHT_BYTES, Engine
+from .index import INDEX_DB_FILE, INDEX_FILE, export_json, find_index, import_json, open_index
+from .journal import JOURNAL_FILE
+from .metrics import METRICS_FILE
+from .results import RESULT_FIELDS, SCAN_DB_FILE, ScanResults
+from .scanner import MIN_WAV_SIZE
+from .store import PACK_FILE
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m wavextractor',
+                                     description="Gömülü WAV çıkarıcı / injector (arayüzsüz)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_common(p):
+        p.add_argument('directory', nargs='?', default=os.getcwd(), help="İşlem dizini (varsayılan: mevcut dizin)")
+        p.add_argument('-q', '--quiet', action='store_true', help="Log satırlarını yazma, yalnızca özeti yaz")
+
+    def add_metrics_options(p):
+        p.add_argument('--report', default=None,
+                       help=f"Ölçüm raporu yolu (.json veya .csv; varsayılan: {EXTRACT_DIR_NAME}/{METRICS_FILE})")
+        p.add_argument('--profile', choices=('cprofile', 'tracemalloc'), default=None,
+                       help="İşlemi profil altında çalıştır (cProfile işçi süreçleri kapsamaz; tam profil için -j 1)")
+
+    def add_output_option(p):
+        p.add_argument('-o', '--output-dir', default=None,
+                       help="Orijinalleri değiştirme; dosyaları bu klasöre klonla (reflink, olmazsa kopya) ve klonları değiştir")
+
+    def add_scan_options(p):
+        p.add_argument('-j', '--workers', type=int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+        p.add_argument('-r', '--recursive', action='store_true', help="Alt dizinleri de tara")
+        p.add_argument('--include', action='append', default=[], metavar='KALIP',
+                       help="Yalnızca bu glob kalıbına uyan dosyaları tara (tekrarlanabilir; '/' içeren kalıplar göreli yola uygulanır)")
+        p.add_argument('--exclude', action='append', default=[], metavar='KALIP',
+                       help="Bu glob kalıbına uyan dosya ve dizinleri atla (tekrarlanabilir)")
+        p.add_argument('--min-size', type=int, default=MIN_WAV_SIZE, metavar='BAYT',
+                       help=f"Bundan küçük dosyaları açma (varsayılan: {MIN_WAV_SIZE})")
+        p.add_argument('--inflight-mb', type=int, default=INFLIGHT_BYTES // (1024 * 1024),
+                       help="İş hattında aynı anda bulunabilecek dosya verisi (MB)")
+        p.add_argument('--ogg', action='store_true',
+                       help="Ogg akışlarını da ara (ikinci bir tarama geçişi; tarama yaklaşık yarı hıza düşer)")
+
+    p = sub.add_parser('extract', help="WAV'ları çıkar ve yerlerini sıfırla")
+    add_common(p)
+    add_scan_options(p)
+    add_metrics_options(p)
+    add_output_option(p)
+    p.add_argument('--punch-holes', action='store_true', help="Boşaltılan alanları diskten sil (seyrek dosya)")
+    p.add_argument('--json-index', action='store_true', help=f"İndeksi {INDEX_DB_FILE} yerine {INDEX_FILE} olarak yaz")
+    p.add_argument('--full', action='store_true', help="Değişmemiş dosyaları da yeniden tara")
+    p.add_argument('--content-hash', action='store_true', help="Parmak izine örneklenmiş içerik özetini ekle")
+    p.add_argument('--dedupe', action='store_true',
+                   help="Aynı içerikli WAV'ları bir kez sakla (<dosya>_<ofset>.wav adları ortak bloba bağlanır; "
+                        "birini düzenlemek aynı içerikli tüm konumları değiştirir)")
+    p.add_argument('--no-links', action='store_true', help="--dedupe ile <dosya>_<ofset>.wav bağlarını oluşturma, yalnızca bloblar")
+    p.add_argument('--no-zero-copy', action='store_true', help="WAV'ları çekirdek içi kopya yerine Python tamponlarıyla yaz")
+    p.add_argument('--pack', action='store_true',
+                   help=f"WAV'ları ayrı dosyalar yerine {EXTRACT_DIR_NAME}/{PACK_FILE} paketine ekle")
+
+    p = sub.add_parser('inject', help="Çıkarılan WAV'ları orijinal dosyalara geri yaz")
+    add_common(p)
+    add_output_option(p)
+    add_metrics_options(p)
+
+    p = sub.add_parser('verify', help="Hedef dosyaları çıkarılan WAV'larla karşılaştır; hiçbir şey yazma")
+    add_common(p)
+    add_output_option(p)
+    add_metrics_options(p)
+
+    p = sub.add_parser('scan', help=f"Yalnızca tara; dosyalara dokunma, sonuçları {SCAN_DB_FILE} dosyasına yaz")
+    add_common(p)
+    add_scan_options(p)
+    add_metrics_options(p)
+    p.add_argument('--results', default=None, help=f"Sonuç dosyası (varsayılan: DİZİN/{SCAN_DB_FILE})")
+
+    p = sub.add_parser('query', help=f"scan sonuçlarını ({SCAN_DB_FILE}) süz ve toplamları yaz")
+    add_common(p)
+    p.add_argument('--results', default=None, help=f"Sonuç dosyası (varsayılan: DİZİN/{SCAN_DB_FILE})")
+    p.add_argument('--file', default=None, metavar='KALIP', help="Kaynak dosya yolu için glob kalıbı (ör. '*.pak')")
+    p.add_argument('--format', dest='fmt', choices=('wav', 'wem', 'ogg'), default=None, help="Yalnızca bu biçim")
+    p.add_argument('--min-size', type=int, default=None, metavar='BAYT')
+    p.add_argument('--max-size', type=int, default=None, metavar='BAYT')
+    p.add_argument('--min-duration', type=float, default=None, metavar='SANİYE')
+    p.add_argument('--max-duration', type=float, default=None, metavar='SANİYE')
+    p.add_argument('--limit', type=int, default=None, help="En fazla bu kadar kayıt listele")
+
+    p = sub.add_parser('unpack', help=f"{PACK_FILE} paketindeki WAV'ları tek tek .wav dosyaları olarak dışa aktar")
+    add_common(p)
+
+    p = sub.add_parser('recover', help=f"Yarım kalan çıkarmanın {JOURNAL_FILE} günlüğündeki girişleri indekse ekle")
+    add_common(p)
+
+    p = sub.add_parser('revert', help=f"Yarım kalan çıkarmayı {JOURNAL_FILE} günlüğünden tamamen geri al")
+    add_common(p)
+
+    p = sub.add_parser('export-json', help=f"İndeksi {INDEX_FILE} biçiminde dışa aktar")
+    add_common(p)
+    p.add_argument('-o', '--output', default=None, help=f"Çıktı dosyası (varsayılan: DİZİN/{INDEX_FILE})")
+
+    p = sub.add_parser('import-json', help=f"{INDEX_FILE} dosyasını {INDEX_DB_FILE} indeksine aktar")
+    add_common(p)
+    p.add_argument('-i', '--input', default=None, help=f"Girdi dosyası (varsayılan: DİZİN/{INDEX_FILE})")
+    return parser
+
+
+def run_engine(args):
+    def log(message):
+        if not args.quiet:
+            print(message, flush=True)
+
+    def show_progress(value):
+        sys.stderr.write(f"\r{value:3d}%")
+        sys.stderr.flush()
+
+    progress = show_progress if sys.stderr.isatty() else None
+
+    options = {}
+    if args.command in ('extract', 'inject', 'verify', 'scan'):
+        options.update(report_path=args.report, profile=args.profile)
+    if args.command in ('extract', 'inject', 'verify'):
+        options.update(output_dir=args.output_dir)
+    if args.command == 'scan':
+        options.update(results_path=args.results)
+    if args.command in ('extract', 'scan'):
+        options.update(workers=args.workers, recursive=args.recursive, include=args.include, exclude=args.exclude,
+                       min_size=args.min_size, inflight_bytes=args.inflight_mb * 1024 * 1024, ogg=args.ogg)
+    if args.command == 'extract':
+        options.update(punch_holes=args.punch_holes, index_format='json' if args.json_index else 'sqlite',
+                       incremental=not args.full, content_hash=args.content_hash,
+                       dedupe=args.dedupe, link_names=not args.no_links, zero_copy=not args.no_zero_copy,
+                       pack=args.pack)
+
+    engine = Engine(args.directory, log=log, progress=progress, **options)
+    message = engine.run(args.command)
+    if progress is not None:
+        sys.stderr.write("\n")
+    print(message)
+    # İşlemi başlatamayan durumlar (indeks/klasör yok vb.) log yerine sonuç mesajıyla bildirilir
+    failed = message.endswith(("tamamlanamadı.", "yapılamıyor."))
+    return 1 if engine.metrics.counters['errors'] or failed else 0
+
+
+def run_query(args):
+    path = args.results or os.path.join(args.directory, SCAN_DB_FILE)
+    if not os.path.exists(path):
+        print(f"[!] {SCAN_DB_FILE} bulunamadı: {args.directory} (önce 'scan' çalıştırın)")
+        return 1
+    filters = dict(file=args.file, fmt=args.fmt, min_size=args.min_size, max_size=args.max_size,
+                   min_duration=args.min_duration, max_duration=args.max_duration)
+    results = ScanResults(path)
+    try:
+        if not args.quiet:
+            print("\t".join(RESULT_FIELDS))
+            for row in results.query(limit=args.limit, **filters):
+                print("\t".join("" if row[key] is None else str(row[key]) for key in RESULT_FIELDS))
+        count, nbytes, duration, files, archive_bytes = results.summary(**filters)
+    finally:
+        results.close()
+    share = f" (%{nbytes * 100 / archive_bytes:.1f})" if archive_bytes else ""
+    print(f"[=] {count} kayıt, {nbytes} bayt, {duration:.1f} s ses; "
+          f"{files} dosyada, bu dosyaların toplamı {archive_bytes} bayt{share}.")
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'export-json':
+        index_path = find_index(args.directory)
+        if index_path is None or index_path.endswith('.json'):
+            print(f"[!] {INDEX_DB_FILE} bulunamadı: {args.directory}")
+            return 1
+        output = args.output or os.path.join(args.directory, INDEX_FILE)
+        index = open_index(index_path)
+        try:
+            export_json(index, output)
+        finally:
+            index.close()
+        print(f"[+] İndeks dışa aktarıldı: {output}")
+        return 0
+
+    if args.command == 'query':
+        return run_query(args)
+
+    if args.command == 'import-json':
+        source = args.input or os.path.join(args.directory, INDEX_FILE)
+        if not os.path.exists(source):
+            print(f"[!] {INDEX_FILE} bulunamadı: {source}")
+            return 1
+        count = import_json(source, os.path.join(args.directory, INDEX_DB_FILE))
+        print(f"[+] {count} giriş {INDEX_DB_FILE} indeksine aktarıldı.")
+        return 0
+
+    return run_engine(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
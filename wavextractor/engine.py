@@ -0,0 +1,1061 @@
+"""Çıkarma / inject motoru: dosyaları aşamalı iş hattından geçirir, taramayı işçi süreçlere dağıtır, indeksi yönetir."""
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from collections import namedtuple
+from contextlib import closing
+from functools import partial
+
+from .fileio import clear_regions, clone_file, copy_range, crc32_range, is_filled, prefetch_file, write_payload
+from .index import INDEX_DB_FILE, INDEX_FILE, INDEX_FILES, file_fingerprint, find_index, open_index
+from .journal import JOURNAL_FILE, Journal, read_journal
+from .metrics import METRICS_FILE, PROFILE_FILE, TRACEMALLOC_FILE, Metrics, Profiler, timed_call
+from .pipeline import ByteBudget, Job, Pipeline
+from .results import SCAN_DB_FILE, ScanResults
+from .scanner import MIN_WAV_SIZE, describe_hit, find_wavs, map_file, merge_range_results, scan_range
+from .store import PACK_FILE, PackWriter, SourceCache, link_or_copy, same_file, source_fits, store_blob
+from .walk import FileWalker
+
+EXTRACT_DIR_NAME = "extracted_wavs" # Klasör adını sabitledik
+SPLIT_SIZE = 1024*1024*1024 # Bu boyuttan büyük dosyalar bayt aralıklarına bölünerek paralel taranır
+SPLIT_CHUNK = 256*1024*1024
+INFLIGHT_BYTES = 512*1024*1024 # İş hattında aynı anda bulunabilecek dosya baytı (önceden okunan dahil)
+# Taramaya katılmayan kendi dosyalarımız
+SKIP_FILES = INDEX_FILES + (JOURNAL_FILE, SCAN_DB_FILE, SCAN_DB_FILE + "-journal")
+
+
+# İşçi süreçlere aktarılan çıkarma seçenekleri:
+#   punch_holes: boşaltılan alanları fallocate(PUNCH_HOLE) ile diskten sil
+#   dedupe: aynı içerikli WAV'ları blobs/ altında içerik özetine göre bir kez sakla
+#   link_names: dedupe açıkken <dosya>_<ofset>.wav adlarını bloblara sabit bağ olarak oluştur
+#   zero_copy: WAV'ları kaynak dosyadan çekirdek içinde kopyala (copy_file_range/sendfile)
+#   pack: WAV'ları ayrı dosyalar yerine extract klasöründeki tek paket dosyasına ekle (PACK_FILE)
+ExtractOptions = namedtuple('ExtractOptions', 'punch_holes dedupe link_names zero_copy pack',
+                            defaults=(False, False, True, True, False))
+
+
+def write_hits(path, extract_dir_path, hits, rejected=(), overflows=(), options=ExtractOptions(), journal=None,
+               pack=None, previous=None, resuming=False):
+    """Bulunan WAV'ları extract klasörüne yazar; orijinal dosyaya dokunmaz.
+
+    (entries, messages, regions) döndürür: regions, sıfırlanması gereken
+    [(offset, size)] bölgeleridir (bkz. clear_hit_regions). journal verilirse
+    sıfırlanacak her giriş, bölgesi regions'a eklenmeden önce günlüğe yazılır.
+    Girişler günlüğe WAV'ları yazıldıktan sonra eklenir (bkz. Journal.append).
+    pack (PackWriter) verilirse WAV'lar tek tek dosyalar yerine pakete eklenir;
+    extract_path yalnızca dışa aktarımda (bkz. Engine.unpack) oluşturulur.
+
+    previous, dosyanın indekste zaten olan girişleridir ({offset: giriş}).
+    Yeniden bulunmayanlar, bölgeleri hâlâ sıfırsa (WAV hâlâ çıkarılmışsa)
+    entries'e eklenir; dosya değiştiyse atılır. resuming açıksa (yarım kalan
+    çalıştırmadan devam) hem arşivdeki bölgesinin hem çıkarılmış kaynağının
+    CRC32'si tutan WAV yeniden yazılmaz, diğerleri için extract_path'in
+    varlığına güvenilmez (yarım yazılmış olabilir).
+    """
+    entries = []
+    messages = []
+    regions = []
+    previous = dict(previous or {})
+
+    for offset, size in rejected:
+        messages.append(f"    [-] Geçersiz başlık ({size} bayt) bulundu: '{path}' @ {offset}. Atlanıyor.")
+
+    data = map_file(path) if hits or previous else None
+    if data is not None:
+        # mmap yalnızca içerik özeti (dedupe) veya zero_copy kapalıyken okunur;
+        # WAV'ların kendisi src'den çekirdek içinde kopyalanır
+        # sources yalnızca yarım kalan çalıştırmanın kaynaklarını doğrulamak için açılır
+        with data, memoryview(data) as view, open(path, 'rb', buffering=0) as src, \
+                closing(SourceCache(extract_dir_path)) as sources:
+            src_fd = src.fileno() if options.zero_copy else None
+            for offset, size, ext in hits:
+                end = offset + size
+                extract_name = f"{os.path.basename(path)}_{offset}.{ext}"
+                extract_path = os.path.join(extract_dir_path, extract_name)
+                entry = {
+                    'file_path': path,
+                    'offset': offset,
+                    'length': size,
+                    'extract_path': extract_path,
+                    # Bölge bulunduğuna göre arşivde hâlâ özgün WAV var; WAV zaten çıkarılmış
+                    # olsa da inject'in değişmemiş girişleri atlayabilmesi için saklanır
+                    'crc32': zlib.crc32(view[offset:end])
+                }
+
+                earlier = previous.pop(offset, None)
+                if resuming and earlier is not None and earlier['length'] == size \
+                        and ('pack_offset' in earlier) == (pack is not None) \
+                        and earlier.get('crc32') == entry['crc32'] and sources.intact(earlier):
+                    # Önceki çalıştırmada kalıcı yazılmış ama bölgesi sıfırlanmadan kesilmiş
+                    entry = earlier
+                    if journal is not None:
+                        journal.append(entry, pack.path if pack is not None else None)
+                    regions.append((offset, size))
+                    messages.append(f"    -> WAV önceki çalıştırmada çıkarılmış, kaldığı yerden devam: {extract_name}")
+                elif pack is not None:
+                    with view[offset:end] as payload:
+                        digest, entry['pack_offset'], written = pack.reserve(payload)
+                        if digest is not None:
+                            entry['content_hash'] = digest
+                        if written:
+                            pack.write(entry['pack_offset'], payload, src_fd, offset)
+                        if journal is not None:
+                            journal.append(entry, pack.path)
+                    if written:
+                        messages.append(f"    -> WAV bulundu ve pakete eklendi: {extract_name}")
+                    else:
+                        messages.append(f"    -> WAV bulundu, aynı içerik zaten pakette: {extract_name}")
+                    regions.append((offset, size))
+                elif options.dedupe:
+                    digest, stored_path, written = store_blob(extract_dir_path, view[offset:end], ext, src_fd, offset)
+                    entry['content_hash'] = digest
+                    if not options.link_names:
+                        entry['extract_path'] = stored_path
+                    elif not os.path.exists(extract_path):
+                        link_or_copy(stored_path, extract_path)
+                    elif not same_file(extract_path, stored_path):
+                        # Aynı adla farklı içerik var; eski davranıştaki gibi dokunma
+                        messages.append(f"    -> WAV zaten çıkarılmış: {extract_name}. Atlanıyor.")
+                        entries.append(entry)
+                        continue
+                    if journal is not None:
+                        journal.append(entry)
+                    regions.append((offset, size))
+                    if written:
+                        messages.append(f"    -> WAV bulundu ve çıkarıldı: {extract_name}")
+                    else:
+                        messages.append(f"    -> WAV bulundu, aynı içerik zaten depoda: {extract_name}")
+                # Çıkarılacak dosyanın zaten var olup olmadığını kontrol et
+                elif not resuming and os.path.exists(extract_path):
+                    messages.append(f"    -> WAV zaten çıkarılmış: {extract_name}. Atlanıyor.")
+                else:
+                    with open(extract_path, 'wb') as out:
+                        write_payload(out.fileno(), view[offset:end], src_fd, offset)
+                    if journal is not None:
+                        journal.append(entry)
+                    regions.append((offset, size))
+                    messages.append(f"    -> WAV bulundu ve çıkarıldı: {extract_name}")
+
+                entries.append(entry)
+
+            # Bölgeleri önceki çalıştırmalarda sıfırlanmış girişler yeniden bulunmaz ama
+            # indekste kalmalıdır; bölgesi artık sıfır olmayan veya yeni bir WAV ile
+            # çakışanlar eskidir ve inject'te yeni içeriğin üzerine yazılmamalıdır
+            found = [(offset, offset + size) for offset, size, _ in hits]
+            stale = 0
+            for offset in sorted(previous):
+                earlier = previous[offset]
+                end = offset + earlier['length']
+                if end <= len(view) and is_filled(view, offset, earlier['length']) \
+                        and not any(offset < stop and start < end for start, stop in found):
+                    entries.append(earlier)
+                else:
+                    stale += 1
+            if stale:
+                messages.append(f"    -> Dosya değişmiş; {stale} eski giriş indeksten çıkarıldı.")
+
+    for offset, size in overflows:
+        messages.append(f"    [-] '{path}' dosyasında belirtilen WAV boyutu dosya sınırlarını aşıyor @ {offset}. Atlanıyor.")
+    return entries, messages, regions
+
+
+def clear_hit_regions(path, regions, options=ExtractOptions()):
+    """Çıkarılan WAV'ların orijinal dosyadaki yerlerini sıfırlar; log mesajlarını döndürür."""
+    # Tüm bölgeler tek tanıtıcıyla, bitişikler birleştirilerek
+    if not regions:
+        return []
+    punched = clear_regions(path, regions, options.punch_holes)
+    if punched:
+        return [f"    -> {punched} bayt seyrek delik olarak boşaltıldı."]
+    return []
+
+
+def scan_file(path, ogg=False):
+    """Tek bir dosyayı salt okunur tarar (işçi süreçte çalışır)."""
+    data = map_file(path)
+    if data is None:
+        return [], [], []
+    with data:
+        return find_wavs(data, ogg=ogg)
+
+
+def _ignore(*args):
+    pass
+
+
+def _write_stage(job, extract_dir_path, options, metrics, journal, pack):
+    with metrics.timer('write', job=job) as timer:
+        entries, messages, regions = write_hits(job.path, extract_dir_path, *job.result, options, journal, pack,
+                                                job.previous, job.checkpoint is not None)
+        timer.nbytes = sum(size for _, size in regions)
+    metrics.count(job, extracted_bytes=timer.nbytes)
+    # Yazma aşaması tek thread'dir; bu noktadaki sayı dosyanın son girişini kapsar
+    job.result = entries, messages, regions, journal.count
+    journal.commit_if_due()
+
+
+def _clone_output(job, target, metrics):
+    """job.path'i target'a klonlar (reflink, olmazsa kopya) ve ölçümlere ekler."""
+    with metrics.timer('clone', job.size, job):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        reflinked = clone_file(job.path, target)
+    metrics.count(job, cloned_files=1, reflinked_files=int(reflinked))
+
+
+def _clear_stage(job, options, metrics, journal, output_path=None):
+    _, _, regions, journaled = job.result
+    if output_path is None and regions and not journal.is_durable(journaled):
+        # Bölgeler, girişleri ve WAV'ları diske kalıcı yazılmadan sıfırlanmaz; iş,
+        # günlüğün bir sonraki toplu kalıcı yazmasına kadar bekletilir (bkz. Engine.extract_files)
+        job.deferred = True
+        return
+    _clear_job(job, options, metrics, output_path)
+
+
+def _clear_job(job, options, metrics, output_path=None):
+    entries, messages, regions, _ = job.result
+    target = job.path
+    cleared = regions
+    if output_path is not None:
+        # Orijinale dokunulmaz: ondan taze klonlanan çıktı dosyasında indeksteki tüm
+        # bölgeler sıfırlanır. Veri orijinalde durduğu için günlük beklenmez.
+        target = output_path(job.path)
+        _clone_output(job, target, metrics)
+        cleared = [(entry['offset'], entry['length']) for entry in entries]
+    with metrics.timer('zero_fill', sum(size for _, size in cleared), job):
+        messages.extend(clear_hit_regions(target, cleared, options))
+    job.result = entries, messages, len(cleared)
+
+
+def _describe_stage(job, metrics):
+    """scan modunda bulunan kayıtların ses bilgisini başlıklardan okur (bkz. describe_hit)."""
+    hits, rejected, overflows = job.result
+    infos = []
+    if hits:
+        with metrics.timer('describe', job=job):
+            with map_file(job.path) as data:
+                infos = [describe_hit(data, offset, size, ext) for offset, size, ext in hits]
+    job.result = hits, rejected, overflows, infos
+
+
+def _format_info(info):
+    parts = []
+    if info.sample_rate:
+        parts.append(f"{info.sample_rate} Hz")
+    if info.channels:
+        parts.append(f"{info.channels} kanal")
+    if info.bits:
+        parts.append(f"{info.bits} bit")
+    if info.duration is not None:
+        parts.append(f"{info.duration:.2f} s")
+    return "".join(f", {part}" for part in parts)
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class ByteProgress:
+    """İlerlemeyi dosya sayısına göre değil işlenen bayta göre hesaplar.
+
+    Geri çağırma yalnızca yüzde değiştiğinde yapılır; böylece bir işlem boyunca
+    en fazla 101 ilerleme bildirimi gönderilir. Büyük dosyaların taranan
+    aralıkları tarama thread'lerinden bildirildiği için thread güvenlidir.
+    """
+
+    def __init__(self, callback, total):
+        self.callback = callback
+        self.total = total
+        self.done = 0
+        self.percent = -1
+        self.lock = threading.Lock()
+
+    def advance(self, nbytes):
+        with self.lock:
+            self._set(self.done + nbytes)
+
+    def set(self, done):
+        with self.lock:
+            self._set(done)
+
+    def _set(self, done):
+        self.done = done
+        percent = min(100, int(self.done * 100 / self.total)) if self.total else 100
+        if percent != self.percent:
+            self.percent = percent
+            self.callback(percent)
+
+
+class Engine:
+    """Qt'den bağımsız çıkarma/inject motoru.
+
+    İlerleme log, progress, counter ve status geri çağırmalarıyla bildirilir;
+    GUI bunları Qt sinyallerine, CLI ise terminale bağlar. extract(), inject()
+    ve scan() işlem sonunda gösterilecek özet mesajı döndürür.
+    """
+
+    def __init__(self, base_dir, workers=None, recursive=False, punch_holes=False, index_format='sqlite',
+                 incremental=True, content_hash=False, dedupe=False, link_names=True, zero_copy=True, pack=False,
+                 ogg=False, output_dir=None, include=(), exclude=(), min_size=MIN_WAV_SIZE, inflight_bytes=INFLIGHT_BYTES,
+                 results_path=None, report_path=None, profile=None,
+                 log=None, progress=None, counter=None, status=None):
+        self.base_dir = base_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.recursive = recursive # Alt dizinler de taransın mı
+        self.include = tuple(include) # Yalnızca bu glob kalıplarına uyan dosyalar taranır (boşsa hepsi)
+        self.exclude = tuple(exclude) # Bu kalıplara uyan dosya ve dizinler atlanır
+        self.min_size = min_size # Bundan küçük dosyalar WAV içeremez; açılmaz
+        self.ogg = ogg # Ogg akışları da aransın mı (ikinci bir tarama geçişi; bkz. scanner)
+        self.options = ExtractOptions(punch_holes, dedupe, link_names, zero_copy, pack)
+        self.index_format = index_format # 'sqlite' (artımlı) veya 'json' (eski biçim)
+        self.incremental = incremental # Parmak izi değişmeyen dosyaları yeniden tarama
+        self.content_hash = content_hash # Parmak izine örneklenmiş içerik özeti de eklensin mi
+        self.output_dir = output_dir # Verilirse orijinaller yerine buradaki klonları değiştir (bkz. output_path)
+        self.inflight_bytes = inflight_bytes # İş hattındaki dosya baytı üst sınırı
+        self.results_path = results_path # scan sonuçları; None ise base_dir/SCAN_DB_FILE
+        self.report_path = report_path # Ölçüm raporu (.json/.csv); None ise extract klasörüne yazılır
+        self.profile = profile # None, 'cprofile' veya 'tracemalloc' (bkz. run)
+        self.profiler = None
+        self.metrics = Metrics()
+        self.log = log or _ignore
+        self.progress = progress or _ignore
+        self.counter = counter or _ignore
+        self.status = status or _ignore
+        self.wav_count = 0
+        self.journal = None # extract sırasında açık günlük; büyük dosyaların aralıkları buraya yazılır
+        self.byte_progress = None # extract/scan sırasındaki ByteProgress; aralık aralık ilerleme için
+
+    def error(self, message):
+        """Hata mesajını log'a yazar ve errors sayacını artırır (CLI çıkış kodu buna bakar)."""
+        self.metrics.count(errors=1)
+        self.log(message)
+
+    def make_executor(self):
+        """Tek işçide süreç başlatma maliyetine girmez; aksi halde 'spawn' ile süreç havuzu kurar.
+
+        Qt thread'leri çalışırken fork güvenli olmadığından her platformda 'spawn' kullanılır.
+        concurrent.futures/multiprocessing burada yüklenir ki CLI hızlı açılsın.
+        """
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        if self.workers <= 1:
+            return ThreadPoolExecutor(max_workers=1)
+        from multiprocessing import get_context
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context('spawn'))
+
+    def output_path(self, path):
+        """Kaynak dosyanın output_dir altındaki karşılığı (base_dir'e göreli yol korunur)."""
+        return os.path.join(self.output_dir, os.path.relpath(path, self.base_dir))
+
+    def list_files(self):
+        """Taranacak dosyaları (yol, boyut) olarak döndürür.
+
+        .py dosyaları, indeks/günlük, çıkarma ve çıktı klasörleri ile
+        exclude'a uyan ya da min_size'dan küçük dosyalar atlanır.
+        """
+        skip_dirs = [os.path.join(self.base_dir, EXTRACT_DIR_NAME)]
+        if self.output_dir:
+            skip_dirs.append(self.output_dir)
+        walker = FileWalker(self.base_dir, self.recursive, self.include, ('*.py',) + self.exclude,
+                            self.min_size, skip_dirs, SKIP_FILES + (EXTRACT_DIR_NAME,))
+        return walker.walk()
+
+    def prefetch(self, job, budget):
+        """İş hattının ilk aşaması: bütçede yer açılınca dosyanın önceden okunmasını başlatır."""
+        with self.metrics.timer('budget_wait'):
+            job.reserved = budget.acquire(job.size)
+        with self.metrics.timer('prefetch'):
+            # Bütçeden büyük dosyanın yalnızca ayrılan kadarı önceden okunur
+            prefetch_file(job.path, job.reserved)
+
+    def scan_job(self, pool, job):
+        """Tarama aşaması: dosyayı işçi süreçte tarar, (hits, rejected, overflows) yazar.
+
+        SPLIT_SIZE'dan büyük dosyalar SPLIT_CHUNK'lık aralıklar halinde paralel
+        taranır ve sonuçlar birleştirilir. Tarama süresi işçide ölçülür: işlemci
+        süresi 'scan', duvar saatinin geri kalanı 'read_wait' aşamasına yazılır.
+        extract sırasında biten her aralık günlüğe kontrol noktası olarak yazılır;
+        yarım kalan çalıştırmada taranmış aralıklar (job.checkpoint) yeniden taranmaz.
+        """
+        if job.size > SPLIT_SIZE:
+            from concurrent.futures import as_completed
+            ranges = [(start, min(start + SPLIT_CHUNK, job.size)) for start in range(0, job.size, SPLIT_CHUNK)]
+            fingerprint, results = job.checkpoint or (None, {})
+            results = dict(results)
+            if self.journal is not None and fingerprint is None:
+                fingerprint = file_fingerprint(job.path, self.content_hash)
+            range_futures = {pool.submit(timed_call, scan_range, job.path, start, stop, self.ogg): (start, stop)
+                             for start, stop in ranges if (start, stop) not in results}
+            wall = cpu = 0.0
+            for future in as_completed(range_futures):
+                result, t_wall, t_cpu = future.result()
+                results[range_futures[future]] = result
+                wall += t_wall
+                cpu += t_cpu
+                if self.byte_progress is not None:
+                    # Tek bir dev arşivde ilerleme çubuğu dosya bitene kadar donmasın
+                    start, stop = range_futures[future]
+                    self.byte_progress.advance(stop - start)
+                    job.progressed += stop - start
+                if self.journal is not None:
+                    self.journal.scan_range(job.path, fingerprint, *range_futures[future], result)
+            job.result = merge_range_results(job.path, ranges, [results[r] for r in ranges], self.ogg)
+        else:
+            job.result, wall, cpu = pool.submit(timed_call, scan_file, job.path, self.ogg).result()
+
+        hits, rejected, overflows = job.result
+        self.metrics.add('scan', cpu, job.size, job)
+        self.metrics.add('read_wait', max(0.0, wall - cpu), 0, job)
+        self.metrics.count(job, files=1, scanned_bytes=job.size, hits=len(hits),
+                           rejected=len(rejected), overflows=len(overflows))
+
+    def run_pipeline(self, pool, jobs, stages):
+        """Önceden okuma ve tarama aşamalarına stages'i ekleyip işleri hattan geçirir.
+
+        Tarama aşaması işçi sayısı kadar thread ile havuzu besler; iş hattan
+        çıkınca ayrılan bütçe geri verilir. cProfile açıksa her aşama kendi
+        thread'inde profillenecek şekilde sarılır.
+        """
+        budget = ByteBudget(self.inflight_bytes)
+        stages = [
+            (partial(self.prefetch, budget=budget), 1),
+            (partial(self.scan_job, pool), self.workers),
+            *stages,
+        ]
+        if self.profiler is not None:
+            stages = [(self.profiler.wrap(func), count) for func, count in stages]
+        pipeline = Pipeline(stages)
+        for job in pipeline.run(jobs):
+            budget.release(job.reserved)
+            yield job
+
+    def run(self, mode):
+        """extract/scan/inject'i ölçüm altında çalıştırır ve özet mesajı döndürür.
+
+        Ölçümler her çalıştırmada sıfırlanır; rapor report_path'e ya da
+        (extract/inject için) extract klasörüne METRICS_FILE olarak yazılır.
+        profile verilmişse işlem cProfile veya tracemalloc altında yürütülür ve
+        sonuç rapor klasörüne kaydedilir, en pahalı satırlar log'a yazılır.
+        """
+        self.metrics = Metrics()
+        self.profiler = Profiler(self.profile) if self.profile else None
+        if self.profiler is not None:
+            self.profiler.start()
+        try:
+            message = getattr(self, mode)()
+        finally:
+            self.metrics.finish()
+            self.finish_run(mode)
+            self.profiler = None
+        return message
+
+    def finish_run(self, mode):
+        """Ölçüm raporunu ve (varsa) profil çıktısını yazar."""
+        extract_dir_path = os.path.join(self.base_dir, EXTRACT_DIR_NAME)
+        report_path = self.report_path
+        if report_path is None and mode in ('extract', 'inject') and os.path.isdir(extract_dir_path):
+            report_path = os.path.join(extract_dir_path, METRICS_FILE)
+        if report_path is not None:
+            try:
+                self.metrics.write(report_path)
+                self.log(f"[=] {self.metrics.summary()}")
+                self.log(f"[+] Ölçüm raporu yazıldı: {report_path}")
+            except OSError as e:
+                self.error(f"[!] Ölçüm raporu yazılırken hata oluştu: {e}")
+
+        if self.profiler is None:
+            return
+        output_dir = os.path.dirname(os.path.abspath(report_path)) if report_path else extract_dir_path
+        profile_name = PROFILE_FILE if self.profile == 'cprofile' else TRACEMALLOC_FILE
+        profile_path = os.path.join(output_dir, profile_name)
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            lines = self.profiler.stop(profile_path)
+        except OSError as e:
+            self.error(f"[!] Profil yazılırken hata oluştu: {e}")
+            return
+        for line in lines:
+            self.log(f"    {line}")
+        self.log(f"[+] Profil yazıldı: {profile_path}")
+
+    def resume_interrupted(self):
+        """Önceki çalıştırmadan kalan günlük varsa girişlerini indekse ekler (extract/inject öncesi).
+
+        extract'ın kaldığı yerden sürmesi için günlüğün kontrol noktasını
+        (Checkpoint) döndürür; günlük yoksa veya okunamadıysa None.
+        """
+        if not os.path.exists(os.path.join(self.base_dir, JOURNAL_FILE)):
+            return None
+        self.log("[=] Yarım kalan bir çıkarma bulundu; günlükten devam ediliyor.")
+        message, checkpoint = self.recover_checkpoint()
+        self.log(f"[=] {message}")
+        return checkpoint
+
+    def recover(self, revert=False):
+        """Yarım kalan bir çıkarmayı günlükten kurtarır ve günlüğü siler.
+
+        Varsayılan olarak kalıcı yazılmış girişler indekse eklenir; böylece
+        sıfırlanmış bölgeler inject ile geri yüklenebilir ve extract kaldığı
+        yerden devam eder. revert açıksa bu girişlerin WAV'ları orijinal
+        dosyalara geri yazılır ve çalıştırmanın etkisi tamamen geri alınır.
+        """
+        return self.recover_checkpoint(revert)[0]
+
+    def recover_checkpoint(self, revert=False):
+        """recover() ile aynıdır; (mesaj, geçerli girişleriyle Checkpoint veya None) döndürür."""
+        journal_path = os.path.join(self.base_dir, JOURNAL_FILE)
+        if not os.path.exists(journal_path):
+            return f"Yarım kalan çalıştırma günlüğü bulunamadı: '{JOURNAL_FILE}'.", None
+        self.status("Kurtarılıyor...")
+        try:
+            checkpoint = read_journal(journal_path)
+        except OSError as e:
+            self.error(f"[!] Günlük okunurken hata oluştu: {e}")
+            self.status("Kurtarma tamamlanamadı.")
+            return "Kurtarma işlemi tamamlanamadı.", None
+        if checkpoint.uncommitted:
+            self.log(f"[=] {checkpoint.uncommitted} giriş kalıcı yazılmadan kesilmiş; bölgeleri sıfırlanmadığı için atlandı.")
+
+        sources = SourceCache(os.path.join(self.base_dir, EXTRACT_DIR_NAME))
+        valid = []
+        for entry in checkpoint.entries:
+            path, source_offset = sources.resolve(entry)
+            if source_fits(_file_size(path), source_offset, entry['length']):
+                valid.append(entry)
+            else:
+                self.error(f"[!] Günlükteki WAV eksik veya bozuk: {entry['extract_path']}. Atlanıyor.")
+
+        if revert:
+            try:
+                restored = self.restore_entries(valid, sources)
+            finally:
+                sources.close()
+            message = f"{restored} adet .wav orijinal dosyalara geri yazıldı; yarım kalan çalıştırma geri alındı."
+            checkpoint = None
+        else:
+            index_path = checkpoint.index_path or os.path.join(self.base_dir, INDEX_DB_FILE)
+            try:
+                self.append_to_index(index_path, valid)
+            except Exception as e:
+                self.error(f"[!] İndeks dosyası yazılırken hata oluştu: {e}")
+                self.status("Kurtarma tamamlanamadı.")
+                return "Kurtarma işlemi tamamlanamadı.", None
+            message = f"Yarım kalan çalıştırmadan {len(valid)} giriş {os.path.basename(index_path)} indeksine eklendi."
+            checkpoint = checkpoint._replace(entries=valid)
+
+        os.remove(journal_path)
+        self.status("Kurtarma tamamlandı.")
+        return message, checkpoint
+
+    def revert(self):
+        return self.recover(revert=True)
+
+    def append_to_index(self, index_path, entries):
+        """Günlük girişlerini indekse ekler; mevcut girişler korunur."""
+        index = open_index(index_path)
+        try:
+            index.append(entries, 1)
+        finally:
+            index.close()
+
+    def restore_entries(self, entries, sources):
+        """Girişlerin WAV'larını orijinal dosyalardaki yerlerine yazar; geri yazılan sayıyı döndürür."""
+        restored = 0
+        by_file = {}
+        for entry in entries:
+            by_file.setdefault(entry['file_path'], []).append(entry)
+        for path, items in by_file.items():
+            try:
+                with open(path, 'r+b', buffering=0) as target:
+                    for item in sorted(items, key=lambda item: item['offset']):
+                        path, source_offset = sources.resolve(item)
+                        source_fd, _ = sources.open(path)
+                        copy_range(source_fd, target.fileno(), source_offset or 0, item['offset'], item['length'])
+                        restored += 1
+                    os.fsync(target.fileno())
+                self.log(f"[+] Geri yazıldı: {path} ({len(items)} giriş)")
+            except Exception as e:
+                self.error(f"[!] Geri yazma hatası: {path} - {e}")
+        return restored
+
+    def extract(self):
+        extract_dir_path = os.path.join(self.base_dir, EXTRACT_DIR_NAME)
+        self.wav_count = 0
+        if not os.path.isdir(self.base_dir):
+            self.status("Tarama tamamlanamadı.")
+            return f"Dizin bulunamadı: '{self.base_dir}'. Tarama işlemi yapılamıyor."
+        checkpoint = self.resume_interrupted()
+        self.status("Taranıyor...")
+
+        try:
+            all_files = self.list_files()
+        except Exception as e:
+             self.error(f"[!] Dizin okunurken hata oluştu: {e}")
+             return "Tarama işlemi tamamlanamadı."
+
+        total = len(all_files)
+        if total == 0:
+            self.status("Tarama tamamlandı.")
+            return f"'{self.base_dir}' dizininde taranacak dosya bulunamadı."
+
+        # Extract klasörü (ve ölçüm raporu) yalnızca taranacak dosya varsa oluşturulur
+        try:
+            os.makedirs(extract_dir_path, exist_ok=True)
+        except OSError as e:
+            self.error(f"[!] Çıkarma klasörü oluşturulurken hata oluştu: {e}")
+            return "Tarama işlemi tamamlanamadı."
+        index_name = INDEX_FILE if self.index_format == 'json' else INDEX_DB_FILE
+        index_path = os.path.join(self.base_dir, index_name)
+        try:
+            index = open_index(index_path)
+        except Exception as e:
+            self.error(f"[!] İndeks dosyası açılırken hata oluştu: {e}")
+            return "Tarama işlemi tamamlanamadı."
+        try:
+            journal = Journal(os.path.join(self.base_dir, JOURNAL_FILE), index_path)
+        except OSError as e:
+            index.close()
+            self.error(f"[!] Günlük dosyası oluşturulurken hata oluştu: {e}")
+            return "Tarama işlemi tamamlanamadı."
+        if checkpoint is not None:
+            journal.carry(checkpoint)
+        pack = None
+        if self.options.pack:
+            try:
+                pack = PackWriter(extract_dir_path, self.options.dedupe, index.pack_contents())
+            except OSError as e:
+                journal.finish(index_path)
+                index.close()
+                self.error(f"[!] Paket dosyası açılırken hata oluştu: {e}")
+                return "Tarama işlemi tamamlanamadı."
+
+        self.journal = journal
+        try:
+            self.extract_files(all_files, index, index_name, journal, pack, extract_dir_path, checkpoint)
+        finally:
+            # Günlük yalnızca indeks yazıldıysa silinir (finish); aksi halde sonraki çalıştırma kurtarır
+            self.journal = None
+            self.byte_progress = None
+            journal.close()
+            if pack is not None:
+                pack.close()
+            self.metrics.add('journal', journal.sync_seconds)
+            self.metrics.count(journal_commits=journal.commits)
+
+        self.status("Tarama tamamlandı.")
+        return f"{self.wav_count} adet gömülü .wav çıkarıldı ve sıfırlandı."
+
+    def extract_files(self, all_files, index, index_name, journal, pack, extract_dir_path, checkpoint=None):
+        """extract()'ın iş hattı kısmı; indeks kalıcı yazılırsa günlüğü kapatıp siler.
+
+        checkpoint (bkz. resume_interrupted) verilirse yarım kalan çalıştırmada
+        tamamlanan dosyalar okunmaz, diğerlerinde taranmış aralıklar ve kalıcı
+        girişler yeniden kullanılır.
+        """
+        # Her dosya önceden okuma → tarama (işçi süreçlerde) → WAV yazma → sıfırlama
+        # aşamalarından geçer; aşamalar farklı dosyalar üzerinde aynı anda çalışır.
+        # Sonuçlar tamamlandıkça log/sayaç/ilerleme geri çağırmalarına ve indekse aktarılır;
+        # indeks girişleri dosya listesi sırasıyla (seq) okunur, böylece çıktı deterministiktir.
+        # Boyutlar dizin dolaşılırken alındı; dosyalar yeniden stat edilmez
+        sizes = [size for _, size in all_files]
+        progress = ByteProgress(self.progress, sum(sizes))
+        skipped = 0
+        resumed_files = 0
+        jobs = []
+        for i, (path, _) in enumerate(all_files):
+            fingerprint = None
+            if self.incremental or checkpoint is not None:
+                try:
+                    fingerprint = file_fingerprint(path, self.content_hash)
+                except OSError:
+                    pass
+            if checkpoint is not None and fingerprint is not None and checkpoint.done.get(path) == fingerprint:
+                # Yarım kalan çalıştırmada tamamlanmış; girişleri indekste veya kurtarmayla geldi
+                index.update_file(path, index.entries_for(path), i, fingerprint)
+                resumed_files += 1
+                progress.advance(sizes[i])
+                continue
+            # Son taramadan beri değişmemiş dosyalar okunmaz; önbellekteki girişleri korunur.
+            # output_dir'de parmak izi orijinale aittir ve klonun (ör. inject -o sonrası)
+            # durumunu göstermez; klon her çalıştırmada orijinalden yeniden oluşturulur.
+            if self.incremental and self.output_dir is None:
+                unchanged = fingerprint is not None and index.fingerprint(path) == fingerprint
+                if unchanged:
+                    index.touch(path, i)
+                    skipped += 1
+                    progress.advance(sizes[i])
+                    continue
+            job = Job(i, path, sizes[i])
+            # Kurtarılan girişler de dahil; yazma aşaması hangilerinin hâlâ geçerli olduğuna bakar
+            job.previous = {entry['offset']: entry for entry in index.entries_for(path)}
+            if checkpoint is not None:
+                done_ranges = checkpoint.ranges.get(path)
+                if done_ranges is not None and done_ranges[0] != fingerprint:
+                    done_ranges = None # Dosya o çalıştırmadan sonra değişmiş
+                job.checkpoint = (fingerprint, done_ranges[1] if done_ranges else {})
+            jobs.append(job)
+
+        self.byte_progress = progress
+        with self.make_executor() as pool:
+            stages = [
+                (partial(_write_stage, extract_dir_path=extract_dir_path, options=self.options,
+                         metrics=self.metrics, journal=journal, pack=pack), 1),
+                (partial(_clear_stage, options=self.options, metrics=self.metrics, journal=journal,
+                         output_path=self.output_path if self.output_dir else None), 1),
+            ]
+            pending = [] # Bölgeleri günlüğün toplu kalıcı yazmasını bekleyen işler
+            for job in self.run_pipeline(pool, jobs, stages):
+                if job.deferred:
+                    pending.append(job)
+                else:
+                    self.finish_extract_job(job, index, journal, progress)
+                journal.commit_if_due()
+                if pending and journal.is_durable(pending[-1].result[3]):
+                    self.clear_pending(pending, index, journal, progress)
+            if pending:
+                journal.commit()
+                self.clear_pending(pending, index, journal, progress)
+
+        if skipped:
+            self.metrics.count(skipped_files=skipped)
+            self.log(f"[=] {skipped} dosya son taramadan beri değişmediği için atlandı.")
+        if resumed_files:
+            self.metrics.count(resumed_files=resumed_files)
+            self.log(f"[=] {resumed_files} dosya yarım kalan çalıştırmada tamamlandığı için atlandı.")
+        try:
+            with self.metrics.timer('index'):
+                index.close()
+            self.log(f"[+] İndeks dosyası oluşturuldu: {index_name}")
+        except Exception as e:
+             self.error(f"[!] İndeks dosyası yazılırken hata oluştu: {e}")
+             return
+        journal.finish(os.path.join(self.base_dir, index_name))
+        self.log(f"[=] Günlük: {journal.count} giriş, {journal.commits} kalıcı yazma.")
+
+    def clear_pending(self, pending, index, journal, progress):
+        """Girişleri kalıcı yazılmış bekleyen işlerin bölgelerini sıfırlar ve işleri tamamlar."""
+        for job in pending:
+            try:
+                _clear_job(job, self.options, self.metrics)
+            except Exception as e:
+                job.error = e
+            self.finish_extract_job(job, index, journal, progress)
+        pending.clear()
+
+    def finish_extract_job(self, job, index, journal, progress):
+        """Hattan çıkan işin sonucunu indekse, günlüğe, log'a ve sayaçlara aktarır."""
+        path = job.path
+        self.log(f"[+] Taranıyor: {path}")
+        try:
+            if job.error is not None:
+                raise job.error
+            entries, messages, extracted = job.result
+            with self.metrics.timer('index'):
+                fingerprint = file_fingerprint(path, self.content_hash)
+                index.update_file(path, entries, job.index, fingerprint)
+            journal.file_done(path, fingerprint)
+            for message in messages:
+                self.log(message)
+            if extracted:
+                self.wav_count += extracted
+                self.counter(self.wav_count)
+        except PermissionError:
+             self.error(f"[!] Erişim Reddedildi: {path}. Atlanıyor.")
+        except Exception as e:
+            self.error(f"[!] HATA işlenirken: {path} - {e}")
+
+        progress.advance(job.size - job.progressed)
+
+    def scan(self):
+        """Yalnızca tarar: dosyalara dokunmaz, çıkarma yapmaz ve indeks yazmaz.
+
+        Bulunan kayıtların konumu ve başlıklardan okunan ses bilgisi
+        results_path'e (varsayılan: base_dir/SCAN_DB_FILE) yazılır; önceki
+        taramanın sonuçları silinir. Sonuçlar 'query' komutuyla süzülebilir.
+        """
+        self.wav_count = 0
+        self.status("Taranıyor...")
+
+        try:
+            all_files = self.list_files()
+        except Exception as e:
+             self.error(f"[!] Dizin okunurken hata oluştu: {e}")
+             return "Tarama işlemi tamamlanamadı."
+
+        total = len(all_files)
+        if total == 0:
+            self.status("Tarama tamamlandı.")
+            return f"'{self.base_dir}' dizininde taranacak dosya bulunamadı."
+
+        results_path = self.results_path or os.path.join(self.base_dir, SCAN_DB_FILE)
+        try:
+            results = ScanResults(results_path)
+            results.clear()
+        except Exception as e:
+            self.error(f"[!] Sonuç dosyası açılırken hata oluştu: {e}")
+            return "Tarama işlemi tamamlanamadı."
+
+        progress = ByteProgress(self.progress, sum(size for _, size in all_files))
+        total_bytes = 0
+        self.byte_progress = progress
+        try:
+            with self.make_executor() as pool:
+                jobs = [Job(i, path, size) for i, (path, size) in enumerate(all_files)]
+                for job in self.run_pipeline(pool, jobs, [(partial(_describe_stage, metrics=self.metrics), 1)]):
+                    path = job.path
+                    self.log(f"[+] Taranıyor: {path}")
+                    try:
+                        if job.error is not None:
+                            raise job.error
+                        hits, rejected, overflows, infos = job.result
+                        for offset, size in rejected:
+                            self.log(f"    [-] Geçersiz başlık ({size} bayt) bulundu: '{path}' @ {offset}. Atlanıyor.")
+                        for (offset, size, ext), info in zip(hits, infos):
+                            self.log(f"    -> {ext.upper()} bulundu @ {offset} ({size} bayt{_format_info(info)})")
+                        for offset, size in overflows:
+                            self.log(f"    [-] '{path}' dosyasında belirtilen WAV boyutu dosya sınırlarını aşıyor @ {offset}. Atlanıyor.")
+                        results.add_file(path, job.size, [(*hit, info) for hit, info in zip(hits, infos)])
+                        if hits:
+                            self.wav_count += len(hits)
+                            total_bytes += sum(size for _, size, _ in hits)
+                            self.counter(self.wav_count)
+                    except PermissionError:
+                         self.error(f"[!] Erişim Reddedildi: {path}. Atlanıyor.")
+                    except Exception as e:
+                        self.error(f"[!] HATA işlenirken: {path} - {e}")
+
+                    progress.advance(job.size - job.progressed)
+        finally:
+            self.byte_progress = None
+            results.close()
+
+        self.log(f"[+] Tarama sonuçları yazıldı: {results_path}")
+        self.status("Tarama tamamlandı.")
+        return f"{self.wav_count} adet gömülü .wav bulundu ({total_bytes} bayt). Dosyalar değiştirilmedi."
+
+    def inject(self, verify=False):
+        """Çıkarılan WAV'ları hedef dosyalara yazar; verify açıksa hiçbir şey yazmadan yalnızca karşılaştırır.
+
+        Girişin sağlama toplamı (crc32) varsa hedef bölge ve kaynak WAV bu
+        değerle aynıysa giriş yeniden yazılmaz; böylece yalnızca düzenlenen
+        sesler diske gider.
+        """
+        action = "Doğrulama" if verify else "Inject"
+        if not verify:
+            self.resume_interrupted()
+        index_file_path = find_index(self.base_dir)
+        extract_dir_path = os.path.join(self.base_dir, EXTRACT_DIR_NAME)
+
+        self.status("Doğrulanıyor..." if verify else "Inject ediliyor...")
+
+        if index_file_path is None:
+            self.status(f"{action} tamamlanamadı.")
+            return f"Kayıt dosyası bulunamadı: '{INDEX_DB_FILE}' / '{INDEX_FILE}'. {action} işlemi yapılamıyor."
+        index_name = os.path.basename(index_file_path)
+
+        if not os.path.exists(extract_dir_path):
+             self.status(f"{action} tamamlanamadı.")
+             return f"Çıkarılan WAV klasörü bulunamadı: '{EXTRACT_DIR_NAME}'. {action} işlemi yapılamıyor."
+
+        try:
+            index = open_index(index_file_path)
+            total = len(index)
+            total_length = index.total_length()
+        except (json.JSONDecodeError, sqlite3.DatabaseError):
+            self.status(f"{action} tamamlanamadı.")
+            return f"Kayıt dosyası bozuk: '{index_name}'. {action} işlemi yapılamıyor."
+        except Exception as e:
+            self.status(f"{action} tamamlanamadı.")
+            return f"Kayıt dosyası okunurken hata oluştu: '{index_name}' - {e}. {action} işlemi yapılamıyor."
+
+        sources = SourceCache(extract_dir_path)
+        try:
+            return self.inject_index(index, total, sources, ByteProgress(self.progress, total_length), verify)
+        finally:
+            sources.close()
+            index.close()
+
+    def verify(self):
+        return self.inject(verify=True)
+
+    def inject_index(self, index, total, sources, progress, verify=False):
+        if total == 0:
+            self.status("Doğrulama tamamlandı." if verify else "Inject tamamlandı.")
+            return "Kayıt dosyasında inject edilecek giriş bulunamadı."
+
+        self.wav_count = total
+        self.counter(self.wav_count)
+
+        # Eksik bilgi kontrolü (uzunluğu bilinmediğinden ilerlemeye katılmaz)
+        for item in index.invalid_entries():
+             self.error(f"[!] Kayıt dosyasında eksik bilgi bulundu: {item}. Atlanıyor.")
+
+        # Girişler hedef dosyaya göre, ofset sırasıyla indeksten okunur; böylece her
+        # hedef dosya yalnızca bir kez açılır ve baştan sona doğru sırayla yazılır.
+        for n, original_file_full_path in enumerate(index.files()):
+            items = index.entries_for(original_file_full_path)
+            group_done = progress.done + sum(item['length'] for item in items)
+            job = Job(n, original_file_full_path, _file_size(original_file_full_path)) # Ölçüm kaydı
+
+            target_path = self.output_path(original_file_full_path) if self.output_dir else original_file_full_path
+            if verify and not os.path.exists(target_path):
+                target_path = original_file_full_path # Klon henüz yok; inject onu orijinalden oluşturur
+            if not os.path.exists(target_path) and not os.path.exists(original_file_full_path):
+                 self.error(f"[!] Orijinal hedef dosya bulunamadı: {original_file_full_path}. {len(items)} giriş atlanıyor.")
+            else:
+                try:
+                    if not os.path.exists(target_path):
+                        # Çıktı klonu yoksa orijinalden oluşturulur; orijinal değiştirilmez
+                        _clone_output(job, target_path, self.metrics)
+                    with open(target_path, 'rb' if verify else 'r+b', buffering=0) as target:
+                        for item in items:
+                            if verify:
+                                self.verify_entry(target.fileno(), item, sources, job)
+                            else:
+                                self.inject_entry(target.fileno(), item, sources, job)
+                            progress.advance(item['length'])
+                except PermissionError:
+                     self.error(f"[!] Erişim Reddedildi: {target_path}. Atlanıyor.")
+                except Exception as e:
+                    self.error(f"[!] {'Doğrulama' if verify else 'Inject'} hatası: {target_path} - {e}")
+
+            progress.set(group_done)
+
+        if verify:
+            mismatched = self.metrics.counters['mismatched_entries']
+            self.status("Doğrulama tamamlandı.")
+            return f"{total} giriş doğrulandı, {mismatched} uyuşmazlık bulundu. Dosyalar değiştirilmedi."
+        unchanged = self.metrics.counters['unchanged_entries']
+        self.status("Inject tamamlandı.")
+        if unchanged:
+            return f"{total - unchanged} adet .wav orijinal dosyalara geri inject edildi; {unchanged} adet zaten güncel olduğu için yazılmadı."
+        return f"{total} adet .wav orijinal dosyalara geri inject edildi."
+
+    def open_source(self, item, sources):
+        """Girişin kaynağını açar; (fd, kaynak ofseti) veya sorun log'a yazıldıysa None döndürür."""
+        extract_file_full_path, source_offset = sources.resolve(item)
+
+        # Dosya varlığı kontrolü
+        if not os.path.exists(extract_file_full_path):
+             self.error(f"[!] Çıkarılan WAV dosyası bulunamadı: {extract_file_full_path}. Atlanıyor.")
+             return None
+
+        # Uzunluk, dosya belleğe okunmadan fstat ile kontrol edilir
+        source_fd, found = sources.open(extract_file_full_path)
+        if not source_fits(found, source_offset, item['length']):
+            self.error(f"[!] Uyuşmayan uzunluk: '{extract_file_full_path}' (beklenen: {item['length']}, bulunan: {found}). Atlanıyor.")
+            return None
+        return source_fd, source_offset or 0
+
+    def inject_entry(self, target_fd, item, sources, job=None):
+        """Tek bir çıkarılmış WAV'ı açık hedef dosyadaki yerine kopyalar; değişmemişse yazmaz."""
+        original_file_full_path = item['file_path']
+        offset = item['offset']
+        length = item['length']
+
+        try:
+            source = self.open_source(item, sources)
+            if source is None:
+                return
+            source_fd, source_offset = source
+            crc = item.get('crc32')
+            if crc is not None:
+                # Önce hedef okunur: sıfırlanmış bölgede kaynak hiç okunmadan yazmaya geçilir
+                with self.metrics.timer('verify', length, job):
+                    unchanged = (crc32_range(target_fd, offset, length) == crc
+                                 and crc32_range(source_fd, source_offset, length) == crc)
+                if unchanged:
+                    self.metrics.count(job, unchanged_entries=1)
+                    return
+            with self.metrics.timer('inject', length, job):
+                copy_range(source_fd, target_fd, source_offset, offset, length)
+            self.metrics.count(job, injected_bytes=length)
+            self.log(f"[+] Inject edildi: {os.path.basename(original_file_full_path)} @ {offset}")
+        except PermissionError:
+             self.error(f"[!] Erişim Reddedildi: {item['extract_path']}. Atlanıyor.")
+        except Exception as e:
+            self.error(f"[!] Inject hatası: {original_file_full_path} @ {offset} - {e}")
+
+    def verify_entry(self, target_fd, item, sources, job=None):
+        """Hedef bölgeyi inject edilecek WAV ile karşılaştırır; farklıysa log'a yazar."""
+        offset = item['offset']
+        length = item['length']
+        name = os.path.basename(item['file_path'])
+        try:
+            source = self.open_source(item, sources)
+            if source is None:
+                self.metrics.count(job, mismatched_entries=1)
+                return
+            source_fd, source_offset = source
+            with self.metrics.timer('verify', length, job):
+                target_crc = crc32_range(target_fd, offset, length)
+                source_crc = crc32_range(source_fd, source_offset, length)
+        except Exception as e:
+            self.metrics.count(job, mismatched_entries=1)
+            self.error(f"[!] Doğrulama hatası: {name} @ {offset} - {e}")
+            return
+        if target_crc == source_crc:
+            return
+        self.metrics.count(job, mismatched_entries=1)
+        if target_crc is None:
+            self.error(f"[!] Uyuşmuyor: {name} @ {offset} (hedef dosya bölgeden kısa)")
+        elif item.get('crc32') is not None and source_crc != item['crc32']:
+            self.error(f"[!] Uyuşmuyor: {name} @ {offset} (WAV çıkarıldıktan sonra düzenlenmiş)")
+        else:
+            self.error(f"[!] Uyuşmuyor: {name} @ {offset} (hedef bölge farklı)")
+
+    def unpack(self):
+        """Paketteki WAV'ları <dosya>_<ofset>.wav dosyaları olarak dışa aktarır; var olanlara dokunmaz.
+
+        Dışa aktarılan dosyalar düzenlenebilir; inject bu dosyalar varken paket yerine onları kullanır.
+        """
+        index_file_path = find_index(self.base_dir)
+        pack_path = os.path.join(self.base_dir, EXTRACT_DIR_NAME, PACK_FILE)
+        self.wav_count = 0
+        self.status("Dışa aktarılıyor...")
+
+        if index_file_path is None:
+            self.status("Dışa aktarma tamamlanamadı.")
+            return f"Kayıt dosyası bulunamadı: '{INDEX_DB_FILE}' / '{INDEX_FILE}'. Dışa aktarma yapılamıyor."
+        if not os.path.exists(pack_path):
+            self.status("Dışa aktarma tamamlanamadı.")
+            return f"Paket dosyası bulunamadı: '{PACK_FILE}'. Dışa aktarma yapılamıyor."
+
+        try:
+            index = open_index(index_file_path)
+            progress = ByteProgress(self.progress, index.total_length())
+        except Exception as e:
+            self.status("Dışa aktarma tamamlanamadı.")
+            return f"Kayıt dosyası okunurken hata oluştu: '{os.path.basename(index_file_path)}' - {e}. Dışa aktarma yapılamıyor."
+
+        try:
+            with open(pack_path, 'rb', buffering=0) as pack:
+                pack_size = os.fstat(pack.fileno()).st_size
+                for item in index:
+                    pack_offset = item.get('pack_offset')
+                    extract_path = item.get('extract_path')
+                    if pack_offset is None or extract_path is None:
+                        continue
+                    progress.advance(item['length'])
+                    if os.path.exists(extract_path):
+                        continue
+                    if not source_fits(pack_size, pack_offset, item['length']):
+                        self.error(f"[!] Paket beklenenden kısa: {os.path.basename(extract_path)} @ {pack_offset}. Atlanıyor.")
+                        continue
+                    try:
+                        with open(extract_path, 'wb') as out:
+                            copy_range(pack.fileno(), out.fileno(), pack_offset, 0, item['length'])
+                    except OSError as e:
+                        self.error(f"[!] Dışa aktarma hatası: {extract_path} - {e}")
+                        continue
+                    self.wav_count += 1
+                    self.counter(self.wav_count)
+        finally:
+            index.close()
+
+        self.status("Dışa aktarma tamamlandı.")
+        return f"{self.wav_count} adet .wav paketten dışa aktarıldı."
@@ -0,0 +1,249 @@
+"""Sıfırlama, seyrek delik açma, çekirdek içi kopyalama ve reflink klonlama yardımcıları."""
+import os
+import sys
+import zlib
+
+FILL_BYTE = b'\x00'
+FILL_BLOCK = FILL_BYTE * (1024*1024) # Sıfırlama için tekrar kullanılan tampon (WAV boyutunda tampon ayrılmaz)
+COPY_BLOCK = 1024*1024 # Çekirdek içi kopya kullanılamadığında parça boyutu
+FALLOC_FL_KEEP_SIZE = 0x01
+FALLOC_FL_PUNCH_HOLE = 0x02
+FICLONE = 0x40049409 # Linux ioctl: dosyanın tamamını yazınca kopyala (reflink) olarak paylaştır
+
+
+_libc_functions = {}
+
+
+def _libc_function(name, *argtypes):
+    """Linux'ta libc'deki name fonksiyonunu ilk kullanımda yükler; kullanılamıyorsa None.
+
+    Modül yüklenirken yüklenmez: her CLI açılışı ve işçi süreç bu maliyete girmez.
+    """
+    if name not in _libc_functions:
+        _libc_functions[name] = _load_libc_function(name, *argtypes)
+    return _libc_functions[name]
+
+
+def _load_libc_function(name, *argtypes):
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import ctypes
+        # Sürecin kendi sembolleri (libc dahil); find_library gibi ldconfig çalıştırmaz
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = getattr(libc, name)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [getattr(ctypes, argtype) for argtype in argtypes]
+    func.restype = ctypes.c_int
+    return func
+
+
+def punch_hole(fd, offset, length):
+    """Bölgeyi dosyada seyrek bir deliğe çevirir (boyut değişmez, okunduğunda sıfır döner).
+
+    Dosya sistemi desteklemiyorsa (veya FILL_BYTE sıfır değilse) False döner.
+    """
+    fallocate = _libc_function('fallocate', 'c_int', 'c_int', 'c_int64', 'c_int64')
+    if fallocate is None or FILL_BYTE != b'\x00':
+        return False
+    return fallocate(fd, FALLOC_FL_PUNCH_HOLE | FALLOC_FL_KEEP_SIZE, offset, length) == 0
+
+
+def fsync_path(path):
+    """Dosyayı (veya dizini) açıp fsync eder; desteklemeyen platformlarda sessizce geçer."""
+    # Windows'ta fsync yazma izni ister; dizinler ise yalnızca okunarak açılabilir
+    flags = os.O_RDONLY if os.path.isdir(path) else os.O_RDWR
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass # Windows'ta dizinler fsync edilemez
+    finally:
+        os.close(fd)
+
+
+def _pwrite(fd, data, offset):
+    if hasattr(os, 'pwrite'):
+        return os.pwrite(fd, data, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.write(fd, data)
+
+
+def _pread(fd, length, offset):
+    if hasattr(os, 'pread'):
+        return os.pread(fd, length, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, length)
+
+
+def crc32_range(fd, offset, length):
+    """fd'deki bölgenin zlib.crc32 değerini COPY_BLOCK'luk parçalar okuyarak hesaplar.
+
+    Dosya bölgeden kısaysa None döner.
+    """
+    crc = 0
+    while length > 0:
+        chunk = _pread(fd, min(length, COPY_BLOCK), offset)
+        if not chunk:
+            return None
+        crc = zlib.crc32(chunk, crc)
+        offset += len(chunk)
+        length -= len(chunk)
+    return crc
+
+
+def is_filled(view, offset, length):
+    """view'in [offset, offset + length) bölgesinin tamamen FILL_BYTE olup olmadığını döndürür."""
+    fill = memoryview(FILL_BLOCK)
+    end = offset + length
+    while offset < end:
+        n = min(len(fill), end - offset)
+        if view[offset:offset + n] != fill[:n]:
+            return False
+        offset += n
+    return True
+
+
+def fill_region(fd, offset, length):
+    """Bölgeyi FILL_BYTE ile doldurur; WAV boyutunda tampon yerine FILL_BLOCK tekrar kullanılır."""
+    block = memoryview(FILL_BLOCK)
+    while length > 0:
+        written = _pwrite(fd, block[:min(length, len(block))], offset)
+        offset += written
+        length -= written
+
+
+def copy_range(src_fd, dst_fd, src_offset, dst_offset, length):
+    """src_fd'deki length baytı dst_fd'de dst_offset konumuna kopyalar.
+
+    Mümkünse veri Python tamponlarından geçmeden çekirdek içinde kopyalanır
+    (önce copy_file_range, sonra sendfile); ikisi de kullanılamazsa COPY_BLOCK
+    boyutlu parçalar halinde okunup yazılır.
+    """
+    if length > 0 and hasattr(os, 'copy_file_range'):
+        try:
+            while length > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, length, src_offset, dst_offset)
+                if copied == 0:
+                    break
+                src_offset += copied
+                dst_offset += copied
+                length -= copied
+        except OSError:
+            pass # Desteklenmiyor (ör. farklı dosya sistemleri); sonraki yönteme geç
+
+    if length > 0 and hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+        try:
+            os.lseek(dst_fd, dst_offset, os.SEEK_SET)
+            while length > 0:
+                copied = os.sendfile(dst_fd, src_fd, src_offset, length)
+                if copied == 0:
+                    break
+                src_offset += copied
+                dst_offset += copied
+                length -= copied
+        except OSError:
+            pass
+
+    while length > 0:
+        os.lseek(src_fd, src_offset, os.SEEK_SET)
+        chunk = os.read(src_fd, min(length, COPY_BLOCK))
+        if not chunk:
+            raise OSError(f"Kaynak dosya beklenenden kısa ({length} bayt eksik)")
+        written = _pwrite(dst_fd, chunk, dst_offset)
+        src_offset += written
+        dst_offset += written
+        length -= written
+
+
+def reflink(src_fd, dst_fd):
+    """dst_fd'yi src_fd'nin reflink klonu yapar (btrfs/XFS); desteklenmiyorsa False döner."""
+    if not sys.platform.startswith('linux'):
+        return False
+    import fcntl
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def clone_file(src, dst):
+    """dst'yi src'nin kopyası olarak oluşturur; reflink yapıldıysa True döndürür.
+
+    Önce FICLONE denenir: bloklar paylaşılır ve yalnızca sonradan yazılan
+    bloklar yer kaplar. Olmazsa copy_range ile kopyalanır (copy_file_range
+    bazı dosya sistemlerinde yine paylaşımlı kopya yapar), son çare düz kopya.
+    """
+    with open(src, 'rb', buffering=0) as source, open(dst, 'wb', buffering=0) as target:
+        if reflink(source.fileno(), target.fileno()):
+            return True
+        copy_range(source.fileno(), target.fileno(), 0, 0, os.fstat(source.fileno()).st_size)
+    return False
+
+
+def write_payload(dst_fd, payload, src_fd=None, src_offset=0, dst_offset=0):
+    """payload'ı dst_fd'nin dst_offset konumundan (varsayılan: baştan) itibaren yazar.
+
+    src_fd verilirse payload'ın baytları Python'dan geçmez; aynı veri
+    src_fd'nin src_offset konumundan copy_range ile kopyalanır ve Python
+    yalnızca ofset ve uzunlukla uğraşır.
+    """
+    if src_fd is not None:
+        copy_range(src_fd, dst_fd, src_offset, dst_offset, len(payload))
+        return
+    view = memoryview(payload)
+    written = 0
+    while written < len(view):
+        written += _pwrite(dst_fd, view[written:], dst_offset + written)
+
+
+def prefetch_file(path, length=0):
+    """Dosyanın ilk length baytının (0: tamamı) sayfa önbelleğine arka planda okunmasını başlatır.
+
+    posix_fadvise WILLNEED çağrısı beklemez; ağ paylaşımlarında okuma, önceki
+    dosya taranırken sürer. Desteklenmeyen platformlarda hiçbir şey yapmaz.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass # Dosya sistemi desteklemiyor; tarama normal okumayla sürer
+    finally:
+        os.close(fd)
+
+
+def coalesce_regions(regions):
+    """Sıralı (offset, length) bölgelerinden bitişik olanları tek bölgede birleştirir."""
+    merged = []
+    for offset, length in sorted(regions):
+        if merged and merged[-1][0] + merged[-1][1] >= offset:
+            last_offset, last_length = merged[-1]
+            merged[-1] = (last_offset, max(last_length, offset + length - last_offset))
+        else:
+            merged.append((offset, length))
+    return merged
+
+
+def clear_regions(path, regions, punch_holes=False):
+    """Çıkarılan WAV'ların yerlerini tek bir dosya tanıtıcısıyla temizler.
+
+    punch_holes açıksa bölgeler önce fallocate(PUNCH_HOLE) ile diskten silinmeye
+    çalışılır; desteklenmeyen dosya sistemlerinde normal doldurmaya dönülür.
+    Delik açılan bayt sayısını döndürür.
+    """
+    punched = 0
+    with open(path, 'r+b') as f:
+        fd = f.fileno()
+        for offset, length in coalesce_regions(regions):
+            if punch_holes and punch_hole(fd, offset, length):
+                punched += length
+            else:
+                fill_region(fd, offset, length)
+    return punched
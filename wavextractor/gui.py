@@ -0,0 +1,239 @@
+"""PyQt5 arayüzü. Yalnızca arayüz başlatılırken içe aktarılır; motor wavextractor.engine'dedir."""
+import os
+import sys
+import threading
+
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QLabel, QProgressBar,
+    QPlainTextEdit, QMessageBox, QPushButton, QHBoxLayout, QFileDialog, QCheckBox
+)
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+from .engine import EXTRACT_DIR_NAME, Engine
+from .index import INDEX_DB_FILE, find_index
+
+FLUSH_INTERVAL = 0.1 # Log/sayaç sinyallerinin toplu gönderilme aralığı (saniye)
+LOG_MAX_LINES = 5000 # Log kutusunda tutulan son satır sayısı
+
+
+class WAVProcessor(QThread):
+    """Engine'i ayrı bir thread'de çalıştırır ve geri çağırmalarını Qt sinyallerine bağlar.
+
+    Log satırları ve sayaç her bulguda değil, GUI thread'indeki bir QTimer ile
+    FLUSH_INTERVAL'da bir toplu olarak gönderilir; log sinyali satır sonlarıyla
+    birleştirilmiş bir grup taşır. On binlerce bulguda GUI thread'i yeniden
+    çizimle boğulmaz, yeni geri çağırma gelmese de bekleyen satırlar gecikmez.
+    Aynı aralıkla Engine ölçümlerinin tek satırlık özeti de gönderilir.
+    """
+    progress = pyqtSignal(int)
+    log = pyqtSignal(str)
+    finished = pyqtSignal(str)
+    update_counter = pyqtSignal(int)
+    set_status_label = pyqtSignal(str) # Durum etiketi için yeni sinyal
+    update_metrics = pyqtSignal(str) # Aşama süreleri / hızları özeti
+
+    def __init__(self, mode, base_dir, **options):
+        super().__init__()
+        self.mode = mode
+        self.pending_lines = []
+        self.pending_count = None
+        self.lock = threading.Lock() # Geri çağırmalar motorun aşama thread'lerinden de gelebilir
+        self.engine = Engine(base_dir, log=self.buffer_log, progress=self.report_progress,
+                             counter=self.buffer_counter, status=self.report_status, **options)
+        # Nesne GUI thread'inde oluşturulduğundan zamanlayıcı da orada çalışır
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(FLUSH_INTERVAL * 1000))
+        self.timer.timeout.connect(self.flush)
+        self.finished.connect(self.timer.stop)
+
+    def start(self):
+        self.timer.start()
+        super().start()
+
+    def buffer_log(self, message):
+        with self.lock:
+            self.pending_lines.append(message)
+
+    def buffer_counter(self, count):
+        with self.lock:
+            self.pending_count = count
+
+    def report_progress(self, value):
+        # ByteProgress yalnızca yüzde değiştiğinde çağırır; sinyal thread'ler arası güvenlidir
+        self.progress.emit(value)
+
+    def report_status(self, text):
+        self.flush()
+        self.set_status_label.emit(text)
+
+    def flush(self):
+        # Sinyaller kilit altında gönderilir; zamanlayıcı ile iş thread'inin grupları sırası bozulmaz
+        with self.lock:
+            if self.pending_lines:
+                self.log.emit("\n".join(self.pending_lines))
+                self.pending_lines = []
+            if self.pending_count is not None:
+                self.update_counter.emit(self.pending_count)
+                self.pending_count = None
+            self.update_metrics.emit(self.engine.metrics.summary())
+
+    def run(self):
+        message = self.engine.run(self.mode)
+        self.flush()
+        self.finished.emit(message)
+
+
+class MainWindow(QWidget):
+    def __init__(self, auto=False):
+        super().__init__()
+        # auto: eski tek adımlı arayüz; mevcut dizinde indeks varsa inject, yoksa
+        # (alt dizinlerle birlikte) extract hemen başlar ve sonuç kutu ile bildirilir
+        self.auto = auto
+        self.setWindowTitle("Gömülü WAV Çıkarıcı / Injector")
+        self.setGeometry(300, 300, 700, 500) # Pencere boyutunu biraz büyüttük
+
+        layout = QVBoxLayout()
+
+        # Dizin Seçimi
+        dir_layout = QHBoxLayout()
+        self.dir_label = QLabel("İşlem Dizini: Mevcut Dizin")
+        self.dir_button = QPushButton("Dizin Seç...")
+        self.dir_button.clicked.connect(self.select_directory)
+        dir_layout.addWidget(self.dir_label)
+        dir_layout.addWidget(self.dir_button)
+        layout.addLayout(dir_layout)
+
+        self.base_directory = os.getcwd() # Başlangıç dizini
+
+        self.label = QLabel("Yapmak istediğiniz işlemi seçin.")
+        self.label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.label)
+
+        self.counter_label = QLabel("Bulunan/Inject Edilen WAV: 0")
+        self.counter_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.counter_label)
+
+        self.metrics_label = QLabel("")
+        self.metrics_label.setAlignment(Qt.AlignCenter)
+        self.metrics_label.setWordWrap(True)
+        layout.addWidget(self.metrics_label)
+
+        self.progress = QProgressBar()
+        self.progress.setValue(0)
+        layout.addWidget(self.progress)
+
+        # Butonlar
+        button_layout = QHBoxLayout()
+        self.extract_button = QPushButton("WAV'ları Çıkar (Boşalt)")
+        self.inject_button = QPushButton("WAV'ları Geri Inject Et")
+
+        button_layout.addWidget(self.extract_button)
+        button_layout.addWidget(self.inject_button)
+        layout.addLayout(button_layout)
+
+        self.extract_button.clicked.connect(lambda: self.start_processing('extract'))
+        self.inject_button.clicked.connect(lambda: self.start_processing('inject'))
+
+        # Seyrek dosya seçeneği: boşaltılan alanlar sıfırla yazılmak yerine diskten silinir
+        self.punch_holes_checkbox = QCheckBox("Boşaltılan alanları diskten sil (seyrek dosya, destekleyen dosya sistemlerinde)")
+        layout.addWidget(self.punch_holes_checkbox)
+
+        # QPlainTextEdit yalnızca görünen satırları çizer; en eski satırlar LOG_MAX_LINES'ta atılır
+        self.log_box = QPlainTextEdit()
+        self.log_box.setReadOnly(True)
+        self.log_box.setMaximumBlockCount(LOG_MAX_LINES)
+        layout.addWidget(self.log_box)
+
+        self.setLayout(layout)
+
+        self.worker = None # Worker thread'i burada saklayacağız
+
+        if self.auto:
+            for widget in (self.dir_button, self.extract_button, self.inject_button, self.punch_holes_checkbox):
+                widget.hide()
+            self.start_processing('inject' if find_index(self.base_directory) else 'extract')
+
+
+    def select_directory(self):
+        # QFileDialog.getExistingDirectory kullanıcının bir dizin seçmesini sağlar
+        directory = QFileDialog.getExistingDirectory(self, "İşlem Yapılacak Dizini Seçin", self.base_directory)
+        if directory:
+            self.base_directory = directory
+            self.dir_label.setText(f"İşlem Dizini: {self.base_directory}")
+            self.log_box.appendPlainText(f"[+] İşlem dizini değiştirildi: {self.base_directory}")
+            # Dizin değiştiğinde sayaçı sıfırlayabiliriz veya duruma göre güncelleyebiliriz.
+            # Şimdilik sadece dizini güncelledik. Sayaç bir sonraki işlemde güncellenecek.
+
+
+    def start_processing(self, mode):
+        if self.worker is not None and self.worker.isRunning():
+            QMessageBox.warning(self, "İşlem Devam Ediyor", "Şu anda bir işlem devam ediyor. Lütfen bekleyin.")
+            return
+
+        # Inject öncesi kontrol
+        if mode == 'inject':
+            index_file_path = find_index(self.base_directory)
+            extract_dir_path = os.path.join(self.base_directory, EXTRACT_DIR_NAME)
+            if index_file_path is None or not os.path.exists(extract_dir_path):
+                missing = []
+                if index_file_path is None:
+                    missing.append(INDEX_DB_FILE)
+                if not os.path.exists(extract_dir_path):
+                     missing.append(EXTRACT_DIR_NAME)
+
+                QMessageBox.warning(self, "Eksik Dosyalar/Klasör",
+                                   f"Inject işlemi için gerekli olan dosya/klasör(ler) bulunamadı:\n{', '.join(missing)}\n"
+                                   "Lütfen önce 'WAV'ları Çıkar' işlemini çalıştırın.")
+                return
+
+        self.log_box.clear() # Yeni işlem başladığında logu temizle
+        self.progress.setValue(0)
+        self.counter_label.setText("Bulunan/Inject Edilen WAV: 0")
+        self.metrics_label.setText("")
+        self.label.setText("İşlem başlatılıyor...")
+
+        # Butonları devre dışı bırak
+        self.extract_button.setEnabled(False)
+        self.inject_button.setEnabled(False)
+        self.dir_button.setEnabled(False)
+        self.punch_holes_checkbox.setEnabled(False)
+
+        self.worker = WAVProcessor(mode, self.base_directory, recursive=self.auto,
+                                   punch_holes=self.punch_holes_checkbox.isChecked())
+        self.worker.progress.connect(self.progress.setValue)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.log.connect(self.append_log)
+        self.worker.update_counter.connect(self.update_wav_count)
+        self.worker.update_metrics.connect(self.metrics_label.setText)
+        self.worker.set_status_label.connect(self.label.setText) # Yeni sinyal bağlantısı
+        self.worker.start()
+
+    def append_log(self, text):
+        # text birden çok satır içerebilir; kaydırma grup başına bir kez yapılır
+        self.log_box.appendPlainText(text)
+        self.log_box.verticalScrollBar().setValue(self.log_box.verticalScrollBar().maximum())
+
+
+    def update_wav_count(self, count):
+        self.counter_label.setText(f"Bulunan/Inject Edilen WAV: {count}")
+
+    def on_finished(self, message):
+        # İşlem bittiğinde butonları tekrar etkinleştir
+        self.extract_button.setEnabled(True)
+        self.inject_button.setEnabled(True)
+        self.dir_button.setEnabled(True)
+        self.punch_holes_checkbox.setEnabled(True)
+
+        # Son mesajı ana etikete yaz
+        self.label.setText(message)
+        # İsteğe bağlı: İşlem bittiğinde bir bilgi kutusu göster
+        if self.auto:
+            QMessageBox.information(self, "Tamamlandı", message)
+        self.log_box.appendPlainText("[+] İşlem tamamlandı.")
+
+
+def main(auto=False):
+    app = QApplication(sys.argv)
+    win = MainWindow(auto)
+    win.show()
+    sys.exit(app.exec_())
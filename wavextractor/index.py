@@ -0,0 +1,293 @@
+"""wav_index arka uçları: SQLite (varsayılan) ve eski JSON biçimi."""
+import hashlib
+import json
+import os
+import sqlite3
+
+INDEX_FILE = "wav_index.json" # Eski biçim; içe/dışa aktarma için hâlâ desteklenir
+INDEX_DB_FILE = "wav_index.sqlite"
+INDEX_FILES = (INDEX_FILE, INDEX_DB_FILE, INDEX_DB_FILE + "-journal")
+FINGERPRINT_SAMPLE = 64*1024 # İçerik özeti için dosyanın başından/ortasından/sonundan okunan bayt
+
+
+class SqliteIndex:
+    """wav_index.sqlite: tarama sırasında dosya dosya yazılan, dosya bazında sorgulanabilen indeks.
+
+    Girişler her dosyanın işi bittiğinde eklenir ve kaydedilir; indeks sonda
+    tek seferde yazılmaz. seq, dosyanın tarama listesindeki sırasıdır ve
+    girişlerin paralel taramadan bağımsız olarak deterministik sırada
+    okunmasını sağlar.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'seq INTEGER NOT NULL, file_path TEXT NOT NULL, offset INTEGER NOT NULL, '
+            'length INTEGER NOT NULL, extract_path TEXT NOT NULL, content_hash TEXT)'
+        )
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(entries)')]
+        if 'content_hash' not in columns: # Tekilleştirme öncesi oluşturulmuş indeks
+            self.conn.execute('ALTER TABLE entries ADD COLUMN content_hash TEXT')
+        if 'pack_offset' not in columns: # Paket modu öncesi oluşturulmuş indeks
+            self.conn.execute('ALTER TABLE entries ADD COLUMN pack_offset INTEGER')
+        if 'crc32' not in columns: # Sağlama toplamı öncesi oluşturulmuş indeks
+            self.conn.execute('ALTER TABLE entries ADD COLUMN crc32 INTEGER')
+        self.conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS entries_file_offset ON entries (file_path, offset)')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS files ('
+            'file_path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, content_hash TEXT)'
+        )
+        self.conn.commit()
+
+    def clear(self):
+        self.conn.execute('DELETE FROM entries')
+        self.conn.execute('DELETE FROM files')
+        self.conn.commit()
+
+    def _insert(self, entries, seq):
+        # Aynı (dosya, ofset) için eski giriş yenisiyle değiştirilir; bir dosya yeniden
+        # tarandığında daha önce çıkarılmış WAV'ların kayıtları kaybolmaz.
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO entries '
+            '(seq, file_path, offset, length, extract_path, content_hash, pack_offset, crc32) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(seq, e['file_path'], e['offset'], e['length'], e['extract_path'], e.get('content_hash'),
+              e.get('pack_offset'), e.get('crc32')) for e in entries]
+        )
+
+    def append(self, entries, seq=0):
+        with self.conn:
+            self._insert(entries, seq)
+
+    def fingerprint(self, file_path):
+        """Dosyanın son taramadaki parmak izini (size, mtime_ns, inode, content_hash) döndürür."""
+        row = self.conn.execute(
+            'SELECT size, mtime_ns, inode, content_hash FROM files WHERE file_path = ?', (file_path,)).fetchone()
+        return tuple(row) if row else None
+
+    def update_file(self, file_path, entries, seq, fingerprint):
+        """Bir dosyanın girişlerini ve tarama sonrası parmak izini tek işlemde kaydeder.
+
+        entries dosyanın geçerli girişlerinin tamamıdır; indeksteki diğerleri silinir.
+        """
+        with self.conn:
+            self.conn.execute('DELETE FROM entries WHERE file_path = ?', (file_path,))
+            self._insert(entries, seq)
+            self.conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)', (file_path, *fingerprint))
+
+    def touch(self, file_path, seq):
+        """Değişmediği için atlanan dosyanın önbellekteki girişlerini bu taramanın sırasına taşır."""
+        with self.conn:
+            self.conn.execute('UPDATE entries SET seq = ? WHERE file_path = ?', (seq, file_path))
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def total_length(self):
+        """Tüm girişlerin toplam bayt uzunluğu (inject ilerlemesi için)."""
+        return self.conn.execute('SELECT COALESCE(SUM(length), 0) FROM entries').fetchone()[0]
+
+    def __iter__(self):
+        cursor = self.conn.execute(
+            'SELECT file_path, offset, length, extract_path, content_hash, pack_offset, crc32 FROM entries ORDER BY seq, offset')
+        for row in cursor:
+            yield _entry_from_row(*row)
+
+    def files(self):
+        """İndekste girişi olan dosyaları tarama sırasına göre döndürür.
+
+        Paketteki girişleri olan dosyalar paket sırasına göre gelir; böylece
+        inject paketi baştan sona sırayla okur.
+        """
+        return [row[0] for row in self.conn.execute(
+            'SELECT file_path FROM entries GROUP BY file_path ORDER BY MIN(pack_offset), MIN(seq)')]
+
+    def pack_contents(self):
+        """Paketteki içerik özetli girişler için (content_hash, pack_offset, length) döndürür."""
+        return self.conn.execute(
+            'SELECT content_hash, MIN(pack_offset), length FROM entries '
+            'WHERE pack_offset IS NOT NULL AND content_hash IS NOT NULL GROUP BY content_hash').fetchall()
+
+    def entries_for(self, file_path):
+        """Bir dosyanın girişlerini ofset sırasıyla döndürür."""
+        cursor = self.conn.execute(
+            'SELECT file_path, offset, length, extract_path, content_hash, pack_offset, crc32 FROM entries '
+            'WHERE file_path = ? ORDER BY offset', (file_path,))
+        return [_entry_from_row(*row) for row in cursor]
+
+    def invalid_entries(self):
+        return [] # Şema eksik alanlara izin vermez
+
+    def close(self):
+        self.conn.close()
+
+
+class JsonIndex:
+    """Eski wav_index.json biçimi; geriye uyumluluk ve içe/dışa aktarma için.
+
+    JSON tek parça yazılabildiğinden eklenen girişler bellekte tutulur ve
+    close() sırasında dosyadaki girişlerle (file_path, offset) anahtarıyla
+    birleştirilerek yazılır; okurken dosyanın tamamı yüklenir.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._appended = None
+        self._entries = None
+        self._cleared = False
+        self._replaced = set() # Girişleri update_file ile baştan verilen dosyalar
+        self._by_file = None
+
+    def clear(self):
+        self._appended = []
+        self._cleared = True
+
+    def append(self, entries, seq=0):
+        if self._appended is None:
+            self._appended = []
+        self._appended.append((seq, entries))
+
+    def fingerprint(self, file_path):
+        return None # JSON biçimi parmak izi saklamaz; her dosya yeniden taranır
+
+    def update_file(self, file_path, entries, seq, fingerprint):
+        self._replaced.add(file_path)
+        self.append(entries, seq)
+
+    def touch(self, file_path, seq):
+        pass
+
+    def _load(self):
+        if self._entries is None:
+            if not os.path.exists(self.path):
+                return [] # İlk çıkarma; henüz yazılmış indeks yok
+            with open(self.path, 'r') as f:
+                self._entries = json.load(f)
+        return self._entries
+
+    def _valid(self):
+        return [item for item in self._load() if not _missing_fields(item)]
+
+    def __len__(self):
+        return len(self._load())
+
+    def total_length(self):
+        return sum(item['length'] for item in self._valid())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def files(self):
+        first = {}
+        for item in self._valid():
+            pack_offset = item.get('pack_offset')
+            key = (0, 0) if pack_offset is None else (1, pack_offset)
+            first[item['file_path']] = min(first.get(item['file_path'], key), key)
+        # sorted kararlıdır: paketsiz dosyalar kayıt sırasını korur
+        return sorted(first, key=first.get)
+
+    def pack_contents(self):
+        contents = {}
+        for item in self._valid():
+            if item.get('pack_offset') is not None and item.get('content_hash'):
+                contents.setdefault(item['content_hash'], (item['content_hash'], item['pack_offset'], item['length']))
+        return list(contents.values())
+
+    def entries_for(self, file_path):
+        if self._by_file is None:
+            self._by_file = {}
+            for item in self._valid():
+                self._by_file.setdefault(item['file_path'], []).append(item)
+        return sorted(self._by_file.get(file_path, ()), key=lambda item: item['offset'])
+
+    def invalid_entries(self):
+        return [item for item in self._load() if _missing_fields(item)]
+
+    def close(self):
+        if self._appended is not None:
+            self._appended.sort(key=lambda pair: pair[0])
+            appended = [entry for _, entries in self._appended for entry in entries]
+            kept = []
+            if not self._cleared and os.path.exists(self.path):
+                # Önceki çalıştırmaların girişleri korunur; aynı (dosya, ofset) yenisiyle değiştirilir
+                keys = {(entry['file_path'], entry['offset']) for entry in appended}
+                kept = [item for item in self._load() if item.get('file_path') not in self._replaced
+                        and (item.get('file_path'), item.get('offset')) not in keys]
+            export_json(kept + appended, self.path)
+            self._appended = None
+
+
+def file_fingerprint(path, content_hash=False):
+    """(size, mtime_ns, inode, content_hash) parmak izini döndürür.
+
+    content_hash açıksa dosyanın başından, ortasından ve sonundan alınan
+    FINGERPRINT_SAMPLE boyutlu örneklerin blake2b özeti eklenir; tüm dosya okunmaz.
+    """
+    st = os.stat(path)
+    digest = None
+    if content_hash:
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for pos in sorted({0, max(st.st_size // 2 - FINGERPRINT_SAMPLE // 2, 0), max(st.st_size - FINGERPRINT_SAMPLE, 0)}):
+                f.seek(pos)
+                h.update(f.read(FINGERPRINT_SAMPLE))
+        digest = h.hexdigest()
+    return (st.st_size, st.st_mtime_ns, st.st_ino, digest)
+
+
+def _entry_from_row(file_path, offset, length, extract_path, content_hash, pack_offset, crc32):
+    entry = {'file_path': file_path, 'offset': offset, 'length': length, 'extract_path': extract_path}
+    if content_hash is not None:
+        entry['content_hash'] = content_hash
+    if pack_offset is not None:
+        entry['pack_offset'] = pack_offset
+    if crc32 is not None:
+        entry['crc32'] = crc32
+    return entry
+
+
+def _missing_fields(item):
+    return any(item.get(key) is None for key in ('extract_path', 'file_path', 'offset', 'length'))
+
+
+def export_json(entries, path):
+    """Girişleri wav_index.json biçiminde, listeyi bellekte kurmadan tek tek yazar."""
+    with open(path, 'w') as f:
+        f.write('[')
+        for i, entry in enumerate(entries):
+            f.write(',\n' if i else '\n')
+            json.dump(entry, f)
+        f.write('\n]\n')
+
+
+def import_json(json_path, db_path):
+    """Eski bir wav_index.json dosyasını SQLite indeksine aktarır."""
+    with open(json_path, 'r') as f:
+        entries = json.load(f)
+    valid = [item for item in entries if not _missing_fields(item)]
+    index = SqliteIndex(db_path)
+    try:
+        index.clear()
+        index.append(valid)
+    finally:
+        index.close()
+    return len(valid)
+
+
+def find_index(base_dir):
+    """base_dir'deki indeks dosyasını döndürür (SQLite öncelikli), yoksa None."""
+    for name in (INDEX_DB_FILE, INDEX_FILE):
+        path = os.path.join(base_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def open_index(path):
+    """Uzantıya göre uygun indeks arka ucunu açar."""
+    if path.endswith('.json'):
+        return JsonIndex(path)
+    return SqliteIndex(path)
@@ -0,0 +1,215 @@
+"""Çıkarma için önden yazmalı günlük (wav_journal.jsonl).
+
+Bir bölge orijinal dosyada sıfırlanmadan önce girişi, WAV'ı yazıldıktan
+sonra günlüğe eklenir ve WAV ile birlikte diske kalıcı olarak yazılır. fsync her WAV için
+değil, COMMIT_ENTRIES giriş veya COMMIT_BYTES bayt biriktiğinde ya da en geç
+CHECKPOINT_INTERVAL saniyede bir toplu yapılır; girişleri henüz kalıcı olmayan
+dosyaların bölgeleri o zamana kadar sıfırlanmadan bekletilir.
+Çalıştırma yarıda kesilirse günlükteki kalıcı girişler indekse eklenerek
+devam edilebilir ya da orijinal dosyalara geri yazılarak tamamen geri alınabilir.
+
+Günlük aynı zamanda kontrol noktasıdır: tamamlanan dosyalar ve büyük
+dosyaların taranmış bayt aralıkları da yazılır; yeniden başlatılan extract
+bunları baştan taramaz (bkz. Checkpoint). Bu kayıtlar her yazılışta
+işletim sistemine aktarılır, en geç CHECKPOINT_INTERVAL saniyede bir kalıcı yazılır.
+
+Biçim, satır başına bir JSON kaydıdır:
+    {"op": "begin", "index": ...}     çalıştırmanın indeks dosyası
+    {"op": "entry", ...}              sıfırlanacak bir WAV (indeks girişi alanları)
+    {"op": "commit", "count": N}      ilk N giriş ve WAV'ları kalıcı
+    {"op": "done", "path": ..., "fingerprint": [...]}
+                                      dosya tamamlandı (girişleri kalıcı, bölgeleri sıfırlandı)
+    {"op": "range", "path": ..., "fingerprint": [...], "start": A, "stop": B,
+     "hits": [...], "rejected": [...], "overflows": [...]}
+                                      büyük dosyanın [A, B) aralığı tarandı
+"""
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+from .fileio import fsync_path
+
+JOURNAL_FILE = "wav_journal.jsonl"
+COMMIT_ENTRIES = 1024 # Bu kadar giriş birikince kalıcı yazma (fsync) yapılır
+COMMIT_BYTES = 256*1024*1024 # ...veya bu kadar WAV baytı birikince
+CHECKPOINT_INTERVAL = 30 # Kontrol noktası kayıtları en geç bu kadar saniyede bir kalıcı yazılır
+
+
+class Journal:
+    """Tek bir çıkarma çalıştırmasının günlüğü; aşama thread'lerinden güvenle kullanılabilir.
+
+    Kalıcı yazmada yalnızca günlük ve o toplu yazmadaki WAV dosyaları (ve
+    dizinleri) fsync edilir; syncfs, sıfırlanan arşiv bölgelerini de diske
+    iteceğinden kullanılmaz.
+    """
+
+    def __init__(self, path, index_path, commit_entries=COMMIT_ENTRIES, commit_bytes=COMMIT_BYTES,
+                 checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.path = path
+        self.commit_entries = commit_entries
+        self.commit_bytes = commit_bytes
+        self.checkpoint_interval = checkpoint_interval
+        self.last_commit = time.monotonic()
+        self.lock = threading.Lock()
+        self.count = 0 # Eklenen giriş sayısı
+        self.durable = 0 # Kalıcı olduğu kesin giriş sayısı
+        self.pending_bytes = 0
+        self.pending_paths = []
+        self.commits = 0
+        self.sync_seconds = 0.0
+        self.file = open(path, 'w', encoding='utf-8')
+        self._write({'op': 'begin', 'index': index_path})
+        self.pending_paths.append(os.path.dirname(os.path.abspath(path)))
+        self.commit()
+
+    def _write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def append(self, entry, data_path=None):
+        """WAV'ı data_path'e yazılmış, sıfırlanacak bir girişi ekler; kalıcı yazma yapmaz.
+
+        data_path, WAV'ın yazıldığı dosyadır (varsayılan: extract_path; paket
+        modunda paket dosyası). Giriş, WAV yazılmadan eklenmemelidir: toplu
+        kalıcı yazma eklenmiş her girişi, dosyası fsync edilmiş sayar.
+        Girişin sırasını döndürür (bkz. is_durable).
+        """
+        with self.lock:
+            self._write({'op': 'entry', **entry})
+            self.count += 1
+            self.pending_bytes += entry['length']
+            self.pending_paths.append(data_path or entry['extract_path'])
+            return self.count
+
+    def is_durable(self, count):
+        """İlk count giriş ve WAV'ları kalıcı yazıldı mı; bölgeler ancak o zaman sıfırlanır."""
+        with self.lock:
+            return count <= self.durable
+
+    def commit_if_due(self):
+        """Kalıcı olmayan girişler COMMIT_ENTRIES/COMMIT_BYTES eşiğini aştıysa veya
+        CHECKPOINT_INTERVAL'dan uzun süredir bekliyorsa kalıcı yazar."""
+        with self.lock:
+            if self.count > self.durable and (self.count - self.durable >= self.commit_entries
+                                              or self.pending_bytes >= self.commit_bytes
+                                              or time.monotonic() - self.last_commit >= self.checkpoint_interval):
+                self._commit()
+
+    def file_done(self, path, fingerprint):
+        """Dosyanın tamamlandığını (bölgeleri sıfırlanıp indekse yazıldığını) kaydeder."""
+        with self.lock:
+            self._write({'op': 'done', 'path': path, 'fingerprint': fingerprint})
+            self._checkpointed()
+
+    def scan_range(self, path, fingerprint, start, stop, result):
+        """Büyük bir dosyanın taranmış [start, stop) aralığını sonucuyla birlikte kaydeder."""
+        hits, rejected, overflows = result
+        with self.lock:
+            self._write({'op': 'range', 'path': path, 'fingerprint': fingerprint, 'start': start, 'stop': stop,
+                         'hits': hits, 'rejected': rejected, 'overflows': overflows})
+            self._checkpointed()
+
+    def carry(self, checkpoint):
+        """Önceki günlüğün kontrol noktalarını bu günlüğe taşır; tekrar kesilirse kaybolmazlar."""
+        with self.lock:
+            for path, fingerprint in checkpoint.done.items():
+                self._write({'op': 'done', 'path': path, 'fingerprint': fingerprint})
+            for path, (fingerprint, ranges) in checkpoint.ranges.items():
+                for (start, stop), (hits, rejected, overflows) in ranges.items():
+                    self._write({'op': 'range', 'path': path, 'fingerprint': fingerprint, 'start': start,
+                                 'stop': stop, 'hits': hits, 'rejected': rejected, 'overflows': overflows})
+            self._commit()
+
+    def _checkpointed(self):
+        # Süreç kapatılırsa kayıt kaybolmasın diye hemen işletim sistemine aktarılır;
+        # işletim sistemi çökmesine karşı kalıcı yazma ise aralıklarla yapılır
+        self.file.flush()
+        if time.monotonic() - self.last_commit >= self.checkpoint_interval:
+            self._commit()
+
+    def commit(self):
+        with self.lock:
+            self._commit()
+
+    def _commit(self):
+        start = time.perf_counter()
+        # commit kaydı girişlerle aynı senkronizasyonda diske iner; okurken yalnızca
+        # son commit kaydından önceki girişlere güvenilir
+        self._write({'op': 'commit', 'count': self.count})
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        for path in dict.fromkeys(self.pending_paths):
+            fsync_path(path)
+        for path in dict.fromkeys(os.path.dirname(path) for path in self.pending_paths):
+            fsync_path(path) # Yeni dosyaların dizin girdileri
+        self.durable = self.count
+        self.pending_bytes = 0
+        self.pending_paths = []
+        self.commits += 1
+        self.sync_seconds += time.perf_counter() - start
+        self.last_commit = time.monotonic()
+
+    def finish(self, index_path):
+        """İndeks kalıcı yazıldıktan sonra günlüğü siler; çalıştırma tamamlanmış sayılır."""
+        with self.lock:
+            self.pending_paths.append(index_path)
+            self._commit()
+            self._close()
+        os.remove(self.path)
+
+    def close(self):
+        """Günlüğü silmeden kapatır (çalıştırma tamamlanamadı; sonra kurtarılabilir)."""
+        with self.lock:
+            self._close()
+
+    def _close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+# read_journal'un sonucu: entries kalıcı girişler, uncommitted kalıcı olmayan giriş
+# sayısı, done {yol: parmak izi}, ranges {yol: (parmak izi, {(start, stop): sonuç})}
+Checkpoint = namedtuple('Checkpoint', 'index_path entries uncommitted done ranges')
+
+
+def _pairs(items):
+    return [tuple(item) for item in items]
+
+
+def read_journal(path):
+    """Yarım kalmış bir günlüğü okur ve Checkpoint olarak döndürür.
+
+    Son commit kaydından sonraki girişlerin WAV'ları eksik olabilir; bu
+    girişlerin bölgeleri henüz sıfırlanmamıştır ve yok sayılır. Yarım yazılmış
+    son satır da yok sayılır. Bir dosyanın done kaydı, girişleri kalıcı
+    yazıldıktan sonra eklendiği için commit'ten sonra gelse de geçerlidir.
+    """
+    index_path = None
+    entries = []
+    durable = 0
+    done = {}
+    ranges = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            op = record.pop('op', None)
+            if op == 'begin':
+                index_path = record.get('index')
+            elif op == 'entry':
+                entries.append(record)
+            elif op == 'commit':
+                durable = record['count']
+            elif op == 'done':
+                done[record['path']] = tuple(record['fingerprint'])
+            elif op == 'range':
+                fingerprint = tuple(record['fingerprint'])
+                previous = ranges.get(record['path'])
+                if previous is None or previous[0] != fingerprint:
+                    previous = ranges[record['path']] = (fingerprint, {})
+                previous[1][(record['start'], record['stop'])] = (
+                    _pairs(record['hits']), _pairs(record['rejected']), _pairs(record['overflows']))
+    return Checkpoint(index_path, entries[:durable], len(entries) - durable, done, ranges)
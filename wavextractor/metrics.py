@@ -0,0 +1,236 @@
+"""Aşama bazında süre/bayt ölçümleri, çalıştırma raporu ve isteğe bağlı profil çıkarma."""
+import csv
+import io
+import json
+import threading
+import time
+
+METRICS_FILE = "wav_metrics.json" # Varsayılan rapor adı (EXTRACT_DIR_NAME altında)
+PROFILE_FILE = "wav_profile.prof" # cProfile çıktısı (pstats biçimi)
+TRACEMALLOC_FILE = "wav_tracemalloc.txt"
+PROFILE_TOP = 15 # Log'a yazılan en pahalı fonksiyon / bellek satırı sayısı
+
+# Rapordaki aşamalar ve GUI özetindeki adları
+PHASES = (
+    ('prefetch', "Önden okuma"),
+    ('budget_wait', "Bütçe bekleme"),
+    ('read_wait', "Okuma bekleme"),
+    ('scan', "Tarama"),
+    ('describe', "Başlık okuma"),
+    ('write', "Yazma"),
+    ('clone', "Klonlama"),
+    ('zero_fill', "Sıfırlama"),
+    ('index', "İndeks"),
+    ('journal', "Günlük"),
+    ('inject', "Inject"),
+    ('verify', "Doğrulama"),
+)
+FILE_FIELDS = ('path', 'size', 'scan_s', 'read_wait_s', 'write_s', 'zero_fill_s', 'inject_s',
+               'hits', 'rejected', 'overflows', 'extracted_bytes', 'injected_bytes')
+
+
+def timed_call(func, *args):
+    """func'ı çağırır; (sonuç, duvar saati, işlemci süresi) döndürür (işçi süreçte çalışır).
+
+    İşlemci süresi thread bazında ölçülür; ikisi arasındaki fark taramanın
+    diskten veri beklediği süreye yaklaşık eşittir.
+    """
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    result = func(*args)
+    return result, time.perf_counter() - wall, time.thread_time() - cpu
+
+
+class Metrics:
+    """Bir çalıştırmanın aşama süreleri, bayt sayaçları ve dosya bazında kayıtları.
+
+    İş hattı aşamaları farklı thread'lerden yazdığı için tüm güncellemeler
+    kilitle yapılır; summary() çalışma sırasında GUI'den okunabilir.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.finished = None
+        self.phases = {name: [0.0, 0] for name, _ in PHASES} # ad -> [saniye, bayt]
+        self.counters = {'files': 0, 'skipped_files': 0, 'resumed_files': 0, 'scanned_bytes': 0, 'hits': 0,
+                         'rejected': 0, 'overflows': 0, 'extracted_bytes': 0, 'injected_bytes': 0,
+                         'unchanged_entries': 0, 'mismatched_entries': 0, 'journal_commits': 0, 'cloned_files': 0, 'reflinked_files': 0, 'errors': 0}
+        self.files = {}
+
+    def add(self, phase, seconds, nbytes=0, job=None):
+        with self.lock:
+            entry = self.phases[phase]
+            entry[0] += seconds
+            entry[1] += nbytes
+            if job is not None:
+                record = self._record(job)
+                key = phase + '_s'
+                if key in record:
+                    record[key] += seconds
+
+    def timer(self, phase, nbytes=0, job=None):
+        """with bloğunun süresini phase'e ekleyen bağlam yöneticisi."""
+        return _Timer(self, phase, nbytes, job)
+
+    def count(self, job=None, **counts):
+        with self.lock:
+            for name, value in counts.items():
+                self.counters[name] += value
+                if job is not None and name in FILE_FIELDS:
+                    self._record(job)[name] += value
+
+    def _record(self, job):
+        record = self.files.get(job.index)
+        if record is None:
+            record = dict.fromkeys(FILE_FIELDS, 0)
+            record.update(path=job.path, size=job.size)
+            record.update({key: 0.0 for key in FILE_FIELDS if key.endswith('_s')})
+            self.files[job.index] = record
+        return record
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def summary(self):
+        """GUI'de gösterilen tek satırlık canlı özet."""
+        with self.lock:
+            parts = []
+            for name, label in PHASES:
+                seconds, nbytes = self.phases[name]
+                if not seconds:
+                    continue
+                if nbytes:
+                    parts.append(f"{label}: {nbytes / (1024 * 1024):.1f} MB, {nbytes / (1024 * 1024) / seconds:.0f} MB/s")
+                else:
+                    parts.append(f"{label}: {seconds:.2f} s")
+            counters = self.counters
+            parts.append(f"{counters['hits']} bulundu, {counters['rejected']} geçersiz aday")
+        return " | ".join(parts)
+
+    def report(self):
+        with self.lock:
+            phases = {}
+            for name, _ in PHASES:
+                seconds, nbytes = self.phases[name]
+                phases[name] = {
+                    'seconds': round(seconds, 6),
+                    'bytes': nbytes,
+                    'mb_s': round(nbytes / (1024 * 1024) / seconds, 1) if nbytes and seconds else None,
+                }
+            files = [dict(record) for _, record in sorted(self.files.items())]
+            return {
+                'elapsed_s': round(self.elapsed(), 6),
+                'phases': phases,
+                'counters': dict(self.counters),
+                'files': files,
+            }
+
+    def write(self, path):
+        """Raporu yazar: .csv uzantısında dosya bazında satırlar, aksi halde JSON."""
+        report = self.report()
+        if path.lower().endswith('.csv'):
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=FILE_FIELDS)
+                writer.writeheader()
+                for record in report['files']:
+                    writer.writerow({key: (round(value, 6) if isinstance(value, float) else value)
+                                     for key, value in record.items()})
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+class _Timer:
+    def __init__(self, metrics, phase, nbytes, job):
+        self.metrics = metrics
+        self.phase = phase
+        self.nbytes = nbytes
+        self.job = job
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.add(self.phase, time.perf_counter() - self.start, self.nbytes, self.job)
+        return False
+
+
+class Profiler:
+    """Motoru cProfile veya tracemalloc altında çalıştırır (isteğe bağlı).
+
+    cProfile yalnızca etkinleştirildiği thread'i izlediğinden iş hattı
+    aşamaları call() ile sarılır ve her thread'in profili sonda birleştirilir.
+    İşçi süreçler izlenmez; taramanın da profile girmesi için tek işçi (-j 1)
+    kullanılmalıdır. tracemalloc tüm thread'leri kapsar.
+    """
+
+    def __init__(self, kind):
+        if kind not in ('cprofile', 'tracemalloc'):
+            raise ValueError(f"Bilinmeyen profil türü: {kind}")
+        self.kind = kind
+        self.profiles = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def start(self):
+        if self.kind == 'tracemalloc':
+            import tracemalloc
+            tracemalloc.start()
+        else:
+            self._thread_profile().enable()
+
+    def call(self, func, *args, **kwargs):
+        """func'ı geçerli thread'in profili açıkken çalıştırır."""
+        if self.kind != 'cprofile':
+            return func(*args, **kwargs)
+        profile = self._thread_profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+: profil tüm thread'leri kapsar, ikinci bir profil açılamaz
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+
+    def wrap(self, func):
+        return lambda *args, **kwargs: self.call(func, *args, **kwargs)
+
+    def _thread_profile(self):
+        profile = getattr(self.local, 'profile', None)
+        if profile is None:
+            import cProfile
+            profile = cProfile.Profile()
+            self.local.profile = profile
+            with self.lock:
+                self.profiles.append(profile)
+        return profile
+
+    def stop(self, path):
+        """Profili durdurur, path'e yazar ve log'a yazılacak özet satırlarını döndürür."""
+        if self.kind == 'tracemalloc':
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            stats = snapshot.statistics('lineno')
+            lines = [f"Bellek: şu an {current / (1024 * 1024):.1f} MB, en yüksek {peak / (1024 * 1024):.1f} MB"]
+            lines += [str(stat) for stat in stats[:PROFILE_TOP]]
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("\n".join(lines + [str(stat) for stat in stats[PROFILE_TOP:]]) + "\n")
+            return lines
+
+        import pstats
+        self._thread_profile().disable()
+        stats = pstats.Stats(*self.profiles)
+        stats.dump_stats(path)
+        out = io.StringIO()
+        stats.stream = out
+        stats.sort_stats('cumulative').print_stats(PROFILE_TOP)
+        return [line for line in out.getvalue().splitlines() if line.strip()]
@@ -0,0 +1,115 @@
+"""Dosya işlemeyi birbirine sınırlı kuyruklarla bağlı aşamalara bölen iş hattı.
+
+Her aşama kendi thread(ler)inde çalışır: bir dosya taranırken bir sonraki
+önceden okunur, bir öncekinin WAV'ları yazılır ve ondan öncekinin yerleri
+sıfırlanır. Hatta aynı anda bulunan toplam bayt ByteBudget ile sınırlanır.
+"""
+import queue
+import threading
+
+QUEUE_SIZE = 4 # Aşamalar arası kuyruk uzunluğu (dosya sayısı)
+_DONE = object()
+
+
+class ByteBudget:
+    """Hatta aynı anda bulunabilecek toplam bayt miktarını sınırlar.
+
+    Sınırdan büyük tek bir dosya, hat boşaldığında tek başına kabul edilir.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_flight = 0
+        self.cond = threading.Condition()
+
+    def acquire(self, nbytes):
+        """Yer açılana kadar bekler; ayrılan bayt miktarını döndürür."""
+        nbytes = min(nbytes, self.limit)
+        with self.cond:
+            while self.in_flight and self.in_flight + nbytes > self.limit:
+                self.cond.wait()
+            self.in_flight += nbytes
+        return nbytes
+
+    def release(self, nbytes):
+        with self.cond:
+            self.in_flight -= nbytes
+            self.cond.notify_all()
+
+
+class Job:
+    """Hattan geçen tek dosya; aşamalar sonuçlarını result'a yazar."""
+
+    def __init__(self, index, path, size):
+        self.index = index
+        self.path = path
+        self.size = size
+        self.reserved = 0 # ByteBudget'tan ayrılan bayt
+        self.result = None
+        self.error = None
+        self.previous = None # extract: dosyanın indekste zaten olan girişleri {offset: giriş}
+        self.checkpoint = None # Yarım kalan çalıştırmadan devam: (parmak izi, taranmış aralıklar)
+        self.deferred = False # extract: bölgeler günlüğün toplu kalıcı yazmasından sonra sıfırlanacak
+        self.progressed = 0 # İş bitmeden ilerlemeye eklenen bayt (taranan aralıklar)
+
+
+class Pipeline:
+    """stages: [(func, thread sayısı)] listesi; her func(job) işi yerinde günceller.
+
+    Bir aşamada hata oluşursa job.error doldurulur ve sonraki aşamalar işi
+    değiştirmeden geçirir; hata, iş hattan çıktığında raporlanır.
+    """
+
+    def __init__(self, stages, queue_size=QUEUE_SIZE):
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def run(self, jobs):
+        """İşleri hatta verir ve tamamlandıkça (tamamlanma sırasıyla) döndürür."""
+        queues = [queue.Queue(self.queue_size) for _ in self.stages] + [queue.Queue()]
+        counts = [count for _, count in self.stages] + [1]
+
+        def feed():
+            for job in jobs:
+                queues[0].put(job)
+            for _ in range(counts[0]):
+                queues[0].put(_DONE)
+
+        threads = [threading.Thread(target=feed, daemon=True)]
+        for k, (func, count) in enumerate(self.stages):
+            remaining = [count]
+            lock = threading.Lock()
+            for _ in range(count):
+                threads.append(threading.Thread(
+                    target=self._work, args=(func, queues[k], queues[k + 1], counts[k + 1], remaining, lock),
+                    daemon=True))
+        for thread in threads:
+            thread.start()
+
+        while True:
+            job = queues[-1].get()
+            if job is _DONE:
+                break
+            yield job
+        for thread in threads:
+            thread.join()
+
+    @staticmethod
+    def _work(func, inbox, outbox, next_count, remaining, lock):
+        while True:
+            job = inbox.get()
+            if job is _DONE:
+                # Aşamanın son thread'i bittiğinde sonraki aşamanın tüm thread'lerine bildir
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    for _ in range(next_count):
+                        outbox.put(_DONE)
+                return
+            if job.error is None:
+                try:
+                    func(job)
+                except Exception as e:
+                    job.error = e
+            outbox.put(job)
@@ -0,0 +1,81 @@
+"""Salt okunur taramanın sorgulanabilir sonuçları (wav_scan.sqlite).
+
+scan modu her bulunan kaydın konumunu ve başlıktan okunan ses bilgisini
+buraya yazar; arşivlere dokunulmaz. Sonuçlar dosya, boyut, süre ve biçime
+göre süzülebilir; toplamlar yeniden paketleme öncesi kazancı tahmin etmek
+için kullanılır.
+"""
+import sqlite3
+
+SCAN_DB_FILE = "wav_scan.sqlite"
+RESULT_FIELDS = ('file_path', 'offset', 'length', 'format', 'sample_rate', 'channels', 'bits', 'duration')
+
+
+class ScanResults:
+    """Tarama sonuçları; her dosyanın kayıtları tek işlemde eklenir."""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS hits ('
+            'file_path TEXT NOT NULL, offset INTEGER NOT NULL, length INTEGER NOT NULL, format TEXT NOT NULL, '
+            'sample_rate INTEGER, channels INTEGER, bits INTEGER, duration REAL, PRIMARY KEY (file_path, offset))'
+        )
+        self.conn.execute('CREATE TABLE IF NOT EXISTS files (file_path TEXT PRIMARY KEY, size INTEGER NOT NULL)')
+        self.conn.commit()
+
+    def clear(self):
+        self.conn.execute('DELETE FROM hits')
+        self.conn.execute('DELETE FROM files')
+        self.conn.commit()
+
+    def add_file(self, file_path, size, hits):
+        """Bir dosyanın kayıtlarını yazar; hits [(offset, size, ext, AudioInfo)] listesidir."""
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?)', (file_path, size))
+            self.conn.execute('DELETE FROM hits WHERE file_path = ?', (file_path,))
+            self.conn.executemany(
+                'INSERT INTO hits VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(file_path, offset, length, ext, *info) for offset, length, ext, info in hits]
+            )
+
+    def _where(self, file=None, fmt=None, min_size=None, max_size=None, min_duration=None, max_duration=None):
+        clauses = []
+        params = []
+        for clause, value in (('file_path GLOB ?', file), ('format = ?', fmt),
+                              ('length >= ?', min_size), ('length <= ?', max_size),
+                              ('duration >= ?', min_duration), ('duration <= ?', max_duration)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+    def query(self, limit=None, **filters):
+        """Süzgeçlere uyan kayıtları dosya ve ofset sırasıyla sözlük olarak döndürür.
+
+        Süzgeçler: file (GLOB kalıbı), fmt ('wav'/'wem'/'ogg'), min_size/max_size
+        (bayt), min_duration/max_duration (saniye; süresi bilinmeyenler elenir).
+        """
+        where, params = self._where(**filters)
+        sql = f'SELECT {", ".join(RESULT_FIELDS)} FROM hits{where} ORDER BY file_path, offset'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        for row in self.conn.execute(sql, params):
+            yield dict(zip(RESULT_FIELDS, row))
+
+    def summary(self, **filters):
+        """(kayıt sayısı, toplam bayt, toplam süre, kayıt içeren dosya sayısı, bu dosyaların toplam boyutu)."""
+        where, params = self._where(**filters)
+        count, nbytes, duration, files = self.conn.execute(
+            f'SELECT COUNT(*), COALESCE(SUM(length), 0), COALESCE(SUM(duration), 0), COUNT(DISTINCT file_path) '
+            f'FROM hits{where}', params).fetchone()
+        archive_bytes = self.conn.execute(
+            f'SELECT COALESCE(SUM(size), 0) FROM files WHERE file_path IN (SELECT file_path FROM hits{where})',
+            params).fetchone()[0]
+        return count, nbytes, duration, files, archive_bytes
+
+    def close(self):
+        self.conn.close()
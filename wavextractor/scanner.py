@@ -0,0 +1,346 @@
+"""Gömülü ses kapsayıcılarını (RIFF/WAVE, RIFX, RF64/BW64, Ogg, Wwise WEM) bulan tarayıcı.
+
+Biçimler ortak "çapa" baytlarına göre gruplanır: RIFF ailesinin hepsi
+(RIFF, RIFX, RF64/BW64; WAV ve WEM) +8'de "WAVE" taşır ve tek bir bytes.find
+geçişiyle bulunur. Ogg sayfaları "OggS" ile başlar; bu çapa "WAVE" ile bayt
+paylaşmadığından ikinci bir find geçişi gerektirir ve taramayı yaklaşık
+yarıya yavaşlatır (re ile tek desende aramak find'dan çok daha yavaştır).
+Bu yüzden Ogg yalnızca ogg=True ile aranır; çapalar SCAN_WINDOW'luk
+pencereler halinde, aynı bölge önbellekteyken aranır. Her aday, yükü
+kopyalanmadan önce yalnızca chunk/sayfa başlıkları dolaşılarak doğrulanır.
+"""
+import mmap
+import os
+import struct
+from collections import namedtuple
+from functools import partial
+
+RIFF_MAGIC = b'RIFF'
+WAVE_MAGIC = b'WAVE'
+OGG_MAGIC = b'OggS'
+MIN_WAV_SIZE = 36
+SCAN_WINDOW = 1024*1024 # Çapaların birlikte arandığı pencere boyutu
+WWISE_FORMAT_TAG = 0xFFFF # Wwise Vorbis (.wem) fmt biçim etiketi
+RF64_SIZE_FIELD = 0xFFFFFFFF # RF64'te gerçek boyutun ds64 chunk'ında olduğunu belirtir
+
+
+def _walk_wave_chunks(data, offset, end, endian):
+    """RIFF ailesi bir adayın chunk başlıklarını dolaşır; geçerliyse uzantıyı ('wav'/'wem'), değilse None döndürür.
+
+    Geçerli sayılması için önce 'fmt ' (kanal ve örnekleme hızı sıfır olmayan),
+    ardından 'data' chunk'ının başlığı [offset, end) içinde bulunmalıdır.
+    Yük okunmaz; rastgele veride ilk bir iki chunk'ta elenir.
+    """
+    pos = offset + 12
+    format_tag = None
+    while pos + 8 <= end:
+        chunk_id = data[pos:pos + 4]
+        if not all(32 <= c < 127 for c in chunk_id):
+            return None
+        chunk_size = struct.unpack_from(endian + 'I', data, pos + 4)[0]
+        body = pos + 8
+        if chunk_id == b'fmt ':
+            if chunk_size < 16 or body + 16 > end:
+                return None
+            format_tag, channels, sample_rate = struct.unpack_from(endian + 'HHI', data, body)
+            if channels == 0 or sample_rate == 0:
+                return None
+        elif chunk_id == b'data':
+            if format_tag is None:
+                return None
+            return 'wem' if format_tag == WWISE_FORMAT_TAG else 'wav'
+        pos = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _parse_riff(data, offset, endian):
+    # RIFF chunk boyutu (4 bayt, offset + 4) + 'RIFF' ve boyut alanlarının kendisi (8 bayt)
+    size = struct.unpack_from(endian + 'I', data, offset + 4)[0] + 8
+    if offset + size > len(data):
+        return size, None
+    return size, _walk_wave_chunks(data, offset, offset + size, endian)
+
+
+def _parse_rf64(data, offset):
+    # RF64/BW64: 32 bit boyut alanı 0xFFFFFFFF'dir; gerçek RIFF boyutu hemen ardından
+    # gelen ds64 chunk'ında 64 bit olarak tutulur (4 GB üstü WAV'lar). data chunk'ının
+    # boyutu da 0xFFFFFFFF olabilir; yük okunmadığından doğrulama için gerekmez.
+    if offset + 28 > len(data) or data[offset + 12:offset + 16] != b'ds64':
+        return 0, None
+    size = struct.unpack_from('<I', data, offset + 4)[0]
+    riff_size = struct.unpack_from('<Q', data, offset + 20)[0]
+    size = (riff_size if size == RF64_SIZE_FIELD else size) + 8
+    if offset + size > len(data):
+        return size, None
+    return size, _walk_wave_chunks(data, offset, offset + size, '<')
+
+
+def _parse_ogg(data, offset):
+    """Ogg sayfalarını BOS sayfasından, açılan tüm mantıksal akışlar EOS ile kapanana kadar izler.
+
+    Sayfa zinciri koparsa (sürüm, bayrak veya seri numarası tutarsızsa) aday
+    geçersizdir; zincir dosya sonunu aşarsa aşılan boyut döndürülür.
+    """
+    end = len(data)
+    pos = offset
+    open_streams = set()
+    while True:
+        if pos + 27 > end:
+            return pos + 27 - offset, None
+        header_type = data[pos + 5]
+        if data[pos:pos + 4] != OGG_MAGIC or data[pos + 4] != 0 or header_type & ~7:
+            return pos - offset, None
+        serial = struct.unpack_from('<I', data, pos + 14)[0]
+        segments = data[pos + 26]
+        if pos + 27 + segments > end:
+            return pos + 27 + segments - offset, None
+        if header_type & 2: # BOS: yeni mantıksal akış
+            open_streams.add(serial)
+        elif serial not in open_streams:
+            return pos - offset, None
+        pos += 27 + segments + sum(data[pos + 27:pos + 27 + segments])
+        if header_type & 4: # EOS
+            open_streams.discard(serial)
+            if not open_streams:
+                return pos - offset, ('ogg' if pos <= end else None)
+
+
+# Desteklenen kapsayıcılar. magics başlığın ilk 4 baytıdır; anchor, anchor_offset'te
+# aranan ortak bayt dizisidir. parse(data, offset) -> (boyut, uzantı); uzantı None ise
+# aday yapısal olarak geçersizdir. Yeni bir biçim buraya eklenerek desteklenir.
+Signature = namedtuple('Signature', 'name magics anchor anchor_offset parse')
+
+RIFF_SIGNATURES = (
+    Signature('riff', (RIFF_MAGIC,), WAVE_MAGIC, 8, partial(_parse_riff, endian='<')),
+    Signature('rifx', (b'RIFX',), WAVE_MAGIC, 8, partial(_parse_riff, endian='>')),
+    Signature('rf64', (b'RF64', b'BW64'), WAVE_MAGIC, 8, _parse_rf64),
+)
+SIGNATURES = RIFF_SIGNATURES + (
+    Signature('ogg', (OGG_MAGIC,), OGG_MAGIC, 0, _parse_ogg),
+)
+
+
+def signatures_for(ogg=False):
+    """Aranacak imzalar: varsayılan olarak yalnızca tek geçişte aranan RIFF ailesi, ogg ile Ogg da."""
+    return SIGNATURES if ogg else RIFF_SIGNATURES
+
+
+class _AnchorGroup:
+    """Aynı çapayı paylaşan imzalar; son aramanın sonucunu önbellekte tutar."""
+
+    def __init__(self, anchor, anchor_offset):
+        self.anchor = anchor
+        self.anchor_offset = anchor_offset
+        self.magics = {}
+        self.start = self.upto = 0
+        self.hit = -1
+        self.signature = None
+
+    def covers(self, start):
+        if start < self.start:
+            return False
+        return start <= self.hit if self.hit != -1 else start < self.upto
+
+    def search(self, data, start, stop):
+        """[start, start + SCAN_WINDOW) içinde başlayan ilk adayı arar."""
+        upto = min(stop, start + SCAN_WINDOW)
+        limit = min(len(data), upto + self.anchor_offset + len(self.anchor) - 1)
+        self.start, self.upto, self.hit, self.signature = start, upto, -1, None
+        pos = data.find(self.anchor, start + self.anchor_offset, limit)
+        while pos != -1:
+            offset = pos - self.anchor_offset
+            signature = self.magics.get(data[offset:offset + 4])
+            if signature is not None:
+                self.hit, self.signature = offset, signature
+                return
+            pos = data.find(self.anchor, pos + 1, limit)
+
+
+class SignatureScanner:
+    """Verilen imzaları çapa grubu başına bir geçişte arayan çoklu desen eşleştirici.
+
+    Her çapa grubunun bir sonraki adayı önbellekte tutulur; böylece find(start)
+    art arda çağrıldığında hiçbir bölge aynı çapa için iki kez aranmaz.
+    """
+
+    def __init__(self, data, stop=None, signatures=RIFF_SIGNATURES):
+        self.data = data
+        self.stop = len(data) if stop is None else stop
+        groups = {}
+        for signature in signatures:
+            group = groups.setdefault((signature.anchor, signature.anchor_offset), _AnchorGroup(signature.anchor, signature.anchor_offset))
+            for magic in signature.magics:
+                group.magics[magic] = signature
+        self.groups = list(groups.values())
+
+    def find(self, start):
+        """start'tan itibaren ilk adayın (ofset, imza) çiftini döndürür, yoksa (-1, None)."""
+        while start < self.stop:
+            best, best_signature = -1, None
+            horizon = self.stop
+            for group in self.groups:
+                if not group.covers(start):
+                    group.search(self.data, start, self.stop)
+                if group.hit == -1:
+                    horizon = min(horizon, group.upto)
+                elif best == -1 or group.hit < best:
+                    best, best_signature = group.hit, group.signature
+            if best != -1 and best < horizon:
+                return best, best_signature
+            if best == -1 and horizon >= self.stop:
+                break
+            start = horizon # Aday yoksa tüm gruplar bir sonraki pencereye geçer
+        return -1, None
+
+
+# Başlıklardan okunan ses bilgisi; bilinmeyen alanlar None (ör. Ogg'da bit derinliği)
+AudioInfo = namedtuple('AudioInfo', 'sample_rate channels bits duration')
+
+
+def _describe_riff(data, offset, size):
+    endian = '>' if data[offset:offset + 4] == b'RIFX' else '<'
+    end = offset + size
+    pos = offset + 12
+    fmt = None
+    data_size = None
+    while pos + 8 <= end and (fmt is None or data_size is None):
+        chunk_id = data[pos:pos + 4]
+        chunk_size = struct.unpack_from(endian + 'I', data, pos + 4)[0]
+        body = pos + 8
+        if chunk_id == b'ds64' and body + 16 <= end:
+            data_size = struct.unpack_from('<Q', data, body + 8)[0] # RF64: 64 bit data boyutu
+        elif chunk_id == b'fmt ' and body + 16 <= end:
+            fmt = struct.unpack_from(endian + 'HHIIHH', data, body)
+        elif chunk_id == b'data' and (data_size is None or chunk_size != RF64_SIZE_FIELD):
+            data_size = chunk_size
+        pos = body + chunk_size + (chunk_size & 1)
+    if fmt is None:
+        return AudioInfo(None, None, None, None)
+    _, channels, sample_rate, byte_rate, _, bits = fmt
+    # byte_rate sıkıştırılmış biçimlerde (ör. Wwise Vorbis) ortalamadır; süre yaklaşık olur
+    duration = data_size / byte_rate if byte_rate and data_size is not None else None
+    return AudioInfo(sample_rate, channels, bits or None, duration)
+
+
+def _describe_ogg(data, offset, size):
+    # İlk sayfanın ilk paketi kimlik başlığıdır; süre, aynı akışın son granül konumundan hesaplanır
+    segments = data[offset + 26]
+    packet = offset + 27 + segments
+    serial = struct.unpack_from('<I', data, offset + 14)[0]
+    sample_rate = channels = None
+    granule_rate = None
+    pre_skip = 0
+    if data[packet:packet + 7] == b'\x01vorbis':
+        channels = data[packet + 11]
+        sample_rate = granule_rate = struct.unpack_from('<I', data, packet + 12)[0]
+    elif data[packet:packet + 8] == b'OpusHead':
+        channels = data[packet + 9]
+        pre_skip = struct.unpack_from('<H', data, packet + 10)[0]
+        sample_rate = struct.unpack_from('<I', data, packet + 12)[0] or None
+        granule_rate = 48000 # Opus granül konumu her zaman 48 kHz'dir
+    granule = 0
+    pos = offset
+    end = offset + size
+    while pos + 27 <= end:
+        if struct.unpack_from('<I', data, pos + 14)[0] == serial:
+            page_granule = struct.unpack_from('<q', data, pos + 6)[0]
+            if page_granule > granule: # -1: bu sayfada biten paket yok
+                granule = page_granule
+        page_segments = data[pos + 26]
+        pos += 27 + page_segments + sum(data[pos + 27:pos + 27 + page_segments])
+    duration = max(granule - pre_skip, 0) / granule_rate if granule_rate else None
+    return AudioInfo(sample_rate, channels, None, duration)
+
+
+def describe_hit(data, offset, size, ext):
+    """Bulunan kaydın örnekleme hızı, kanal sayısı, bit derinliği ve süresini başlıklardan okur.
+
+    Yalnızca chunk/sayfa başlıkları okunur; yük okunmaz ve kopyalanmaz.
+    """
+    if ext == 'ogg':
+        return _describe_ogg(data, offset, size)
+    return _describe_riff(data, offset, size)
+
+
+def map_file(path):
+    """Dosyayı salt okunur olarak belleğe eşler (mmap); boş dosyalar için None döner.
+
+    Tüm dosya RAM'e okunmaz; işletim sistemi sayfaları tarama ilerledikçe
+    getirir ve gerektiğinde geri alır, böylece bellek kullanımı dosya
+    boyutundan bağımsız kalır.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        data.madvise(mmap.MADV_SEQUENTIAL)
+    return data
+
+
+def find_wavs(data, start=0, stop=None, ogg=False):
+    """data içinde [start, stop) aralığında başlayan ses kapsayıcılarını sırayla bulur.
+
+    (hits, rejected, overflows) döner: hits kabul edilen [(offset, size, ext)]
+    kayıtlar, rejected yapısal doğrulamadan geçemeyen [(offset, size)] adaylar,
+    overflows ise dosya sınırlarını aşan [(offset, size)] başlıklar. Hatalı bir
+    başlık taramayı durdurmaz; arama bir sonraki bayttan sürer. Kabul edilen
+    bir kaydın içi taranmaz; bir sonraki aday kaydın bitişinden itibaren aranır.
+    ogg açıksa Ogg akışları da aranır (bkz. modül açıklaması).
+    """
+    scanner = SignatureScanner(data, stop, signatures_for(ogg))
+    hits = []
+    rejected = []
+    overflows = []
+    offset, signature = scanner.find(start)
+    while offset != -1:
+        size, ext = signature.parse(data, offset)
+        if offset + size > len(data):
+            overflows.append((offset, size))
+        elif ext is None or size < MIN_WAV_SIZE:
+            rejected.append((offset, size))
+        else:
+            hits.append((offset, size, ext))
+            offset, signature = scanner.find(offset + size)
+            continue
+        offset, signature = scanner.find(offset + 1)
+    return hits, rejected, overflows
+
+
+def scan_range(path, start, stop, ogg=False):
+    """Büyük bir dosyanın [start, stop) bayt aralığını tarar (işçi süreçte çalışır)."""
+    data = map_file(path)
+    if data is None:
+        return [], [], []
+    with data:
+        return find_wavs(data, start, stop, ogg)
+
+
+def merge_range_results(path, ranges, results, ogg=False):
+    """Aralık aralık taranmış bir dosyanın sonuçlarını tek geçişlik taramaya denk olacak şekilde birleştirir.
+
+    Bir aralık, önceki aralıkta bulunan bir WAV'ın içinde başlıyorsa o aralığın
+    bulguları geçersizdir; aralık, o WAV'ın bitişinden itibaren yeniden taranır.
+    """
+    hits = []
+    rejected = []
+    overflows = []
+    next_offset = 0
+    data = None
+    try:
+        for (start, stop), (range_hits, range_rejected, range_overflows) in zip(ranges, results):
+            if next_offset >= stop:
+                continue  # Aralığın tamamı önceki bir WAV'ın içinde
+            if next_offset > start:
+                if data is None:
+                    data = map_file(path)
+                range_hits, range_rejected, range_overflows = find_wavs(data, next_offset, stop, ogg)
+            hits.extend(range_hits)
+            rejected.extend(range_rejected)
+            overflows.extend(range_overflows)
+            if hits:
+                next_offset = max(next_offset, hits[-1][0] + hits[-1][1])
+    finally:
+        if data is not None:
+            data.close()
+    return hits, rejected, overflows
@@ -0,0 +1,182 @@
+"""Çıkarılan WAV'ların deposu: içerik özetine göre tekilleştirilmiş bloblar
+(extracted_wavs/blobs) veya tüm WAV'ları art arda tutan tek paket dosyası
+(extracted_wavs/wavs.pack)."""
+import hashlib
+import os
+import shutil
+from collections import OrderedDict
+
+from .fileio import crc32_range, write_payload
+
+BLOB_DIR_NAME = "blobs" # İçerik özetine göre tekilleştirilmiş WAV deposu (EXTRACT_DIR_NAME altında)
+PACK_FILE = "wavs.pack" # Paket modunda tüm WAV'ların art arda eklendiği dosya (EXTRACT_DIR_NAME altında)
+SOURCE_CACHE_SIZE = 128 # Inject sırasında aynı anda açık tutulan kaynak dosya sayısı
+
+
+def blob_path(extract_dir_path, digest, ext='wav'):
+    """İçerik özetine göre blob yolunu döndürür: blobs/ab/abcdef....wav"""
+    return os.path.join(extract_dir_path, BLOB_DIR_NAME, digest[:2], f"{digest}.{ext}")
+
+
+def payload_digest(payload):
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+def blob_intact(path, digest):
+    """Blobun içeriği hâlâ özetine uyuyor mu; bağlı bir ad yerinde düzenlenmiş olabilir."""
+    h = hashlib.blake2b(digest_size=20)
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024*1024), b''):
+                h.update(block)
+    except FileNotFoundError:
+        return False
+    return h.hexdigest() == digest
+
+
+def store_blob(extract_dir_path, payload, ext='wav', src_fd=None, src_offset=0):
+    """payload'ı içerik özetiyle bir kez saklar; (digest, blob yolu, yeni yazıldı mı) döndürür.
+
+    Aynı blobu yazan işçi süreçler çakışmasın diye önce geçici dosyaya yazılır,
+    sonra os.replace ile yerine taşınır. src_fd verilirse payload yalnızca
+    özet için okunur; blob içeriği write_payload ile çekirdek içinde kopyalanır.
+    İçeriği özetine artık uymayan (düzenlenmiş) blob yeniden kullanılmaz, yenisiyle
+    değiştirilir; düzenlenen içerik ona bağlı eski adlarda kalır.
+    """
+    digest = payload_digest(payload)
+    path = blob_path(extract_dir_path, digest, ext)
+    if os.path.exists(path) and blob_intact(path, digest):
+        return digest, path, False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as out:
+        write_payload(out.fileno(), payload, src_fd, src_offset)
+    os.replace(tmp_path, path)
+    return digest, path, True
+
+
+def link_or_copy(src, dst):
+    """dst'yi src'ye sabit bağ olarak oluşturur; dosya sistemi desteklemiyorsa kopyalar."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def same_file(a, b):
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+def source_fits(size, source_offset, length):
+    """resolve'un verdiği kaynağın (boyutu size) length baytlık girişi karşılayıp karşılamadığı."""
+    if source_offset is None:
+        return size == length
+    return size >= source_offset + length
+
+
+class PackWriter:
+    """WAV'ları tek bir paket dosyasının sonuna ekler; indeks girişleri pack_offset ile konumu tutar.
+
+    Yüz binlerce küçük dosya yerine tek dosya yazıldığından dizin meta verisi
+    yükü oluşmaz. Yer önce reserve ile ayrılır (günlüğe ofsetiyle yazılabilsin
+    diye), veri sonra write ile yazılır. dedupe açıksa aynı içerik pakette bir
+    kez saklanır; önceki çalıştırmaların özetleri known ile verilebilir.
+    Yalnızca yazma aşamasının tek thread'inden kullanılır.
+    """
+
+    def __init__(self, extract_dir_path, dedupe=True, known=()):
+        self.path = os.path.join(extract_dir_path, PACK_FILE)
+        self.dedupe = dedupe
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o666)
+        self.size = os.fstat(self.fd).st_size
+        # Paketin sonunu aşan (ör. kesilmiş bir çalıştırmadan kalan) kayıtlara güvenilmez
+        self.digests = {digest: offset for digest, offset, length in known if offset + length <= self.size}
+
+    def reserve(self, payload):
+        """(digest, pack_offset, yazılmalı mı) döndürür; aynı içerik varsa mevcut ofset verilir."""
+        digest = payload_digest(payload) if self.dedupe else None
+        if digest is not None and digest in self.digests:
+            return digest, self.digests[digest], False
+        offset = self.size
+        self.size += len(payload)
+        if digest is not None:
+            self.digests[digest] = offset
+        return digest, offset, True
+
+    def write(self, offset, payload, src_fd=None, src_offset=0):
+        write_payload(self.fd, payload, src_fd, src_offset, offset)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class SourceCache:
+    """Inject sırasında kaynak WAV'ları açık tutar; paylaşılan bir blob her çalıştırmada bir kez açılır.
+
+    Aynı içerik birçok arşivde/ofsette geçtiğinde girişler blobs/ altındaki tek
+    dosyaya çözülür. Açık dosya sayısı SOURCE_CACHE_SIZE ile sınırlıdır.
+    """
+
+    def __init__(self, extract_dir_path):
+        self.extract_dir_path = extract_dir_path
+        self.files = OrderedDict()
+
+    def resolve(self, item):
+        """Girişin okunacağı (dosya, ofset) çiftini döndürür; ofset None ise dosyanın tamamı WAV'dır.
+
+        Paketteki girişler için dışa aktarılmış <dosya>_<ofset>.wav varsa o
+        (kullanıcı düzenlemiş olabilir), yoksa paketteki pack_offset kullanılır.
+        Tekilleştirilmiş girişlerde değiştirilmemişse blob, aksi halde extract_path.
+        """
+        path = item['extract_path']
+        pack_offset = item.get('pack_offset')
+        if pack_offset is not None:
+            if os.path.exists(path):
+                return path, None
+            return os.path.join(self.extract_dir_path, PACK_FILE), pack_offset
+        digest = item.get('content_hash')
+        if digest:
+            ext = os.path.splitext(path)[1][1:] or 'wav'
+            blob = blob_path(self.extract_dir_path, digest, ext)
+            # Kullanıcı <dosya>_<ofset>.wav'ı yeni bir dosyayla değiştirdiyse onun içeriği kullanılır
+            if os.path.exists(blob) and (not os.path.exists(path) or same_file(path, blob)):
+                return blob, None
+        return path, None
+
+    def open(self, path):
+        """(fd, boyut) döndürür; dosya önceden açıldıysa tekrar açılmaz."""
+        if path in self.files:
+            self.files.move_to_end(path)
+        else:
+            f = open(path, 'rb', buffering=0)
+            self.files[path] = (f, os.fstat(f.fileno()).st_size)
+            if os.path.basename(path) == PACK_FILE and hasattr(os, 'posix_fadvise'):
+                # Paket inject sırasında baştan sona okunur; çekirdek okumayı önden yürütsün
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            if len(self.files) > SOURCE_CACHE_SIZE:
+                self.files.popitem(last=False)[1][0].close()
+        f, size = self.files[path]
+        return f.fileno(), size
+
+    def intact(self, item):
+        """Girişin kaynağı boyutuna ve crc32'sine uyuyor mu; çökmeden sonra yarım veya NUL dolu kalmış olabilir."""
+        path, source_offset = self.resolve(item)
+        try:
+            fd, size = self.open(path)
+        except OSError:
+            return False
+        return source_fits(size, source_offset, item['length']) \
+            and crc32_range(fd, source_offset or 0, item['length']) == item.get('crc32')
+
+    def close(self):
+        for f, _ in self.files.values():
+            f.close()
+        self.files.clear()
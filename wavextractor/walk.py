@@ -0,0 +1,94 @@
+"""Taranacak dosyaları bulan dizin dolaşıcı: os.scandir, glob filtreleri ve boyut eşiği.
+
+os.walk + os.path.isfile/getsize her dosya için ayrı stat çağrısı yapar;
+burada DirEntry'nin önbelleğe aldığı tür bilgisi kullanılır ve boyut için
+dosya başına tek stat yapılır (Windows'ta o da dizin okumasından gelir).
+Alt dizinler seviye seviye bir thread havuzunda okunur; scandir GIL'i
+bıraktığından ağ paylaşımlarında ve soğuk önbellekte gecikmeler örtüşür.
+"""
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+WALK_THREADS = 8 # Alt ağaçları aynı anda okuyan thread sayısı
+
+
+def _matches(rel_path, name, patterns):
+    """'/' içeren kalıplar base_dir'e göreli yola, diğerleri yalnızca ada uygulanır."""
+    for pattern in patterns:
+        if fnmatch.fnmatch(rel_path if '/' in pattern else name, pattern):
+            return True
+    return False
+
+
+class FileWalker:
+    """base_dir altındaki dosyaları (yol, boyut) olarak listeler.
+
+    include verilirse yalnızca ona uyan dosyalar alınır; exclude'a uyan
+    dosyalar ve dizinler (alt ağacıyla birlikte) atlanır. min_size'dan küçük
+    dosyalar açılmaz. skip_dirs mutlak yollarıyla, skip_names adlarıyla
+    atlanır (çıkarma/çıktı klasörleri, indeks, günlük).
+    """
+
+    def __init__(self, base_dir, recursive=False, include=(), exclude=(), min_size=0,
+                 skip_dirs=(), skip_names=(), threads=WALK_THREADS):
+        self.base_dir = base_dir
+        self.recursive = recursive
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.min_size = min_size
+        self.skip_dirs = {os.path.normcase(os.path.abspath(path)) for path in skip_dirs}
+        self.skip_names = set(skip_names)
+        self.threads = threads
+
+    def _rel_path(self, path):
+        return os.path.relpath(path, self.base_dir).replace(os.sep, '/')
+
+    def scan_dir(self, path, strict=False):
+        """Tek bir dizini okur; (dosyalar, alt dizinler) döndürür.
+
+        strict değilse okunamayan alt dizinler os.walk'taki gibi sessizce atlanır.
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name in self.skip_names:
+                        continue
+                    rel_path = self._rel_path(entry.path)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if (self.recursive and not _matches(rel_path, entry.name, self.exclude)
+                                    and os.path.normcase(os.path.abspath(entry.path)) not in self.skip_dirs):
+                                subdirs.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        if self.include and not _matches(rel_path, entry.name, self.include):
+                            continue
+                        if _matches(rel_path, entry.name, self.exclude):
+                            continue
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue # Dolaşma sırasında silinen veya erişilemeyen girdi
+                    if size >= self.min_size:
+                        files.append((entry.path, size))
+        except OSError:
+            if strict:
+                raise
+        return files, subdirs
+
+    def walk(self):
+        """Bulunan (yol, boyut) çiftlerini yola göre sıralı döndürür; base_dir okunamazsa OSError."""
+        files, pending = self.scan_dir(self.base_dir, strict=True)
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.threads) as pool:
+                while pending:
+                    results = list(pool.map(self.scan_dir, pending))
+                    pending = []
+                    for found, subdirs in results:
+                        files.extend(found)
+                        pending.extend(subdirs)
+        files.sort()
+        return files